@@ -8,21 +8,56 @@ via Windows COM automation.
 from __future__ import annotations
 
 import logging
+import math
+import sys
+import threading
 import time
+from array import array
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+if sys.platform == "win32":
+    import pythoncom
+    import win32com.client
+else:  # pywin32 is only available on Windows
+    # Any, not None, so type checking off Windows sees usable module names
+    pythoncom: Any = None
+    win32com: Any = None
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    import numpy as np
+    from numpy.typing import NDArray
+
     from autocad_mcp.config import CADConfig
 
 logger = logging.getLogger(__name__)
 
+# VARIANT type for arrays of doubles (VT_ARRAY | VT_R8)
+_VT_ARRAY_R8 = 0x2000 | 5
+
+# VARIANT type for arrays of objects (VT_ARRAY | VT_DISPATCH)
+_VT_ARRAY_DISPATCH = 0x2000 | 9
+
+# Seconds between readiness checks while a new CAD instance starts
+_STARTUP_POLL_INTERVAL = 0.25
+
+# Failure result template; return a copy so callers may safely modify the result
+_NOT_INITIALIZED: dict[str, Any] = {"success": False, "error": "CAD not initialized"}
+
 # Valid lineweight values in AutoCAD (in hundredths of mm)
 VALID_LINEWEIGHTS: frozenset[int] = frozenset({
     0, 5, 9, 13, 15, 18, 20, 25, 30, 35, 40, 50, 53,
     60, 70, 80, 90, 100, 106, 120, 140, 158, 200, 211
 })
 
+# Bitmask with bit n set for every valid lineweight n
+_LINEWEIGHT_MASK: int = sum(1 << v for v in VALID_LINEWEIGHTS)
+_MAX_LINEWEIGHT: int = max(VALID_LINEWEIGHTS)
+
 # CAD application COM ProgIDs
 CAD_APP_IDS: dict[str, str] = {
     "AUTOCAD": "AutoCAD.Application",
@@ -31,7 +66,7 @@ CAD_APP_IDS: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Point2D:
     """2D coordinate point."""
 
@@ -43,7 +78,7 @@ class Point2D:
         return (self.x, self.y, 0.0)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Point3D:
     """3D coordinate point."""
 
@@ -56,15 +91,68 @@ class Point3D:
         return (self.x, self.y, self.z)
 
 
-def _ensure_3d_point(point: tuple[float, ...]) -> tuple[float, float, float]:
+def _ensure_3d_point(point: Sequence[float]) -> tuple[float, float, float]:
     """Ensure point has 3 coordinates."""
-    if len(point) == 2:
+    n = len(point)
+    if n == 3 and type(point) is tuple:
+        return point
+    if n == 2:
         return (point[0], point[1], 0.0)
-    if len(point) >= 3:
+    if n >= 3:
         return (point[0], point[1], point[2])
     raise ValueError(f"Invalid point: {point}. Expected 2 or 3 coordinates.")
 
 
+def _variant_xyz(x: float, y: float, z: float) -> Any:
+    """Create a VT_ARRAY | VT_R8 VARIANT for a single 3D point."""
+    return win32com.client.VARIANT(_VT_ARRAY_R8, array("d", (x, y, z)))
+
+
+def _is_ndarray(value: Any) -> bool:
+    """Check for a NumPy array without importing NumPy."""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _flatten_ndarray_points(
+    points: NDArray[np.float64],
+    allow_2d: bool = False,
+) -> tuple[array[float], list[tuple[float, float, float]], float | None]:
+    """
+    Flatten an (N, 2) or (N, 3) NumPy point array.
+
+    Args:
+        points: Array of points, one row per vertex.
+        allow_2d: Emit [x1, y1, x2, y2, ...] when all points share one z.
+
+    Returns:
+        Tuple of (flat double array, list of 3D points, elevation). The
+        elevation is the shared z when the flat array is 2D, otherwise None
+        and the flat array is [x1, y1, z1, ...].
+    """
+    import numpy as np
+
+    pts = np.asarray(points, dtype=np.float64)
+    if pts.ndim != 2 or pts.shape[1] < 2:
+        raise ValueError(f"Invalid point array shape {pts.shape}. Expected (N, 2) or (N, 3).")
+
+    if pts.shape[1] == 2:
+        pts3 = np.zeros((pts.shape[0], 3), dtype=np.float64)
+        pts3[:, :2] = pts
+    else:
+        pts3 = np.ascontiguousarray(pts[:, :3])
+
+    elevation: float | None = None
+    coords = pts3
+    if allow_2d and (pts3[:, 2] == pts3[0, 2]).all():
+        elevation = float(pts3[0, 2])
+        coords = np.ascontiguousarray(pts3[:, :2])
+
+    flat = array("d")
+    flat.frombytes(coords.tobytes())
+    return flat, [(x, y, z) for x, y, z in pts3.tolist()], elevation
+
+
 def validate_lineweight(value: int) -> int:
     """
     Validate and return a valid lineweight value.
@@ -75,12 +163,62 @@ def validate_lineweight(value: int) -> int:
     Returns:
         Valid lineweight (input if valid, 0 if invalid).
     """
-    if value in VALID_LINEWEIGHTS:
+    if 0 <= value <= _MAX_LINEWEIGHT and (_LINEWEIGHT_MASK >> value) & 1:
         return value
     logger.warning("Invalid lineweight %d, using default 0", value)
     return 0
 
 
+class _EntityPropSetter:
+    """
+    Apply layer, color and lineweight to new entities.
+
+    Resolving properties (ensuring the layer exists, validating the
+    lineweight) is only redone when the requested values change, which is
+    the common case for batches sharing the same properties. The COM setters
+    still run for every entity.
+    """
+
+    __slots__ = ("_controller", "_last_request", "_resolved")
+
+    def __init__(self, controller: CADController) -> None:
+        self._controller = controller
+        self._last_request: tuple[str | None, int | None, int | None] | None = None
+        self._resolved: tuple[str | None, int | None, int | None] = (None, None, None)
+
+    def reset(self) -> None:
+        """Forget resolved properties (e.g. after switching documents)."""
+        self._last_request = None
+
+    def apply(
+        self,
+        entity: Any,
+        layer: str | None,
+        color: int | None,
+        lineweight: int | None,
+    ) -> None:
+        """Set the requested properties on ``entity``."""
+        request = (layer, color, lineweight)
+        if request != self._last_request:
+            layer_ok = not layer or self._controller.create_layer(layer)
+            self._resolved = (
+                layer,
+                color,
+                validate_lineweight(lineweight) if lineweight is not None else None,
+            )
+            self._last_request = request if layer_ok else None
+
+        layer, color, lineweight = self._resolved
+        if layer:
+            entity.Layer = layer
+
+        if color is not None:
+            entity.Color = color
+
+        if lineweight is not None:
+            entity.Lineweight = lineweight
+
+
 class CADController:
     """
     Controller for AutoCAD COM interface.
@@ -94,12 +232,38 @@ class CADController:
 
         Args:
             config: CAD configuration settings.
+
+        Raises:
+            RuntimeError: If not running on Windows.
         """
+        if win32com is None:
+            raise RuntimeError("CAD automation requires Windows (COM via pywin32)")
+
         self.config = config
         self.app: Any = None
         self.doc: Any = None
         self.model_space: Any = None
         self._com_initialized = False
+        self._com_thread_id: int | None = None
+        self._batching = False
+
+        # Lowercased names of layers known to exist in the current document
+        self._layer_names: set[str] | None = None
+        self._prop_setter = _EntityPropSetter(self)
+
+        # Reusable VT_ARRAY | VT_DISPATCH wrapper for hatch boundary loops
+        self._loop_variant: Any = None
+
+        # Bound ModelSpace methods, cached per connection
+        self._add_line: Any = None
+        self._add_circle: Any = None
+        self._add_arc: Any = None
+        self._add_ellipse: Any = None
+        self._add_polyline: Any = None
+        self._add_lw_polyline: Any = None
+        self._add_text: Any = None
+        self._add_hatch: Any = None
+        self._add_dim_aligned: Any = None
 
     def _init_com(self) -> None:
         """Initialize COM library for current thread."""
@@ -107,56 +271,129 @@ class CADController:
             return
 
         try:
-            import pythoncom
             pythoncom.CoInitialize()
             self._com_initialized = True
+            self._com_thread_id = threading.get_ident()
             logger.debug("COM library initialized")
         except Exception as e:
             logger.warning("COM initialization warning: %s", e)
 
     def _cleanup_com(self) -> None:
-        """Cleanup COM library."""
+        """Cleanup COM library (only on the thread that initialized it)."""
         if not self._com_initialized:
             return
 
+        if self._com_thread_id != threading.get_ident():
+            logger.warning("Skipping COM cleanup: called from a different thread than CoInitialize")
+            return
+
         try:
-            import pythoncom
             pythoncom.CoUninitialize()
             self._com_initialized = False
+            self._com_thread_id = None
             logger.debug("COM library uninitialized")
         except Exception as e:
             logger.warning("COM cleanup warning: %s", e)
 
-    def _create_variant_array(self, points: list[float]) -> Any:
+    def _create_variant_array(self, points: Iterable[float]) -> Any:
         """
         Create a VARIANT array for CAD coordinates.
 
         Args:
-            points: Flat list of coordinates [x1, y1, z1, x2, y2, z2, ...].
+            points: Flat coordinates [x1, y1, z1, x2, y2, z2, ...].
 
         Returns:
             COM VARIANT array suitable for CAD methods.
         """
-        from array import array
-        import pythoncom
-        import win32com.client
+        return win32com.client.VARIANT(_VT_ARRAY_R8, array("d", points))
 
-        return win32com.client.VARIANT(
-            pythoncom.VT_ARRAY | pythoncom.VT_R8,
-            array("d", points)
-        )
+    def _early_bind(self, obj: Any) -> Any:
+        """
+        Wrap a COM object in its makepy-generated early-bound proxy.
+
+        Early-bound proxies cache DISPIDs from the type library, so method
+        calls skip the per-call ``GetIDsOfNames`` lookup. Falls back to the
+        late-bound object if the type library cannot be generated.
+
+        Args:
+            obj: ProgID string or late-bound dispatch object.
+
+        Returns:
+            Early-bound proxy, or a late-bound dispatch on failure.
+        """
+        try:
+            return win32com.client.gencache.EnsureDispatch(obj)
+        except Exception as e:
+            logger.warning("Early binding unavailable, using late binding: %s", e)
+            if isinstance(obj, str):
+                return win32com.client.Dispatch(obj)
+            return obj
+
+    def _bind_model_space_methods(self) -> None:
+        """
+        Cache bound ModelSpace methods.
+
+        Each ``model_space.AddXxx`` access is a separate COM round-trip, so the
+        bound methods are resolved once per connection and reused.
+        """
+        ms = self.model_space
+        self._add_line = ms.AddLine
+        self._add_circle = ms.AddCircle
+        self._add_arc = ms.AddArc
+        self._add_ellipse = ms.AddEllipse
+        self._add_polyline = ms.AddPolyline
+        self._add_lw_polyline = ms.AddLightWeightPolyline
+        self._add_text = ms.AddText
+        self._add_hatch = ms.AddHatch
+        self._add_dim_aligned = ms.AddDimAligned
+
+    def _unbind_model_space_methods(self) -> None:
+        """Drop cached ModelSpace methods so no stale COM references remain."""
+        self._add_line = None
+        self._add_circle = None
+        self._add_arc = None
+        self._add_ellipse = None
+        self._add_polyline = None
+        self._add_lw_polyline = None
+        self._add_text = None
+        self._add_hatch = None
+        self._add_dim_aligned = None
+
+    def _wait_until_ready(self) -> None:
+        """
+        Poll a freshly launched CAD application until it accepts calls.
 
-    def start(self) -> bool:
+        Raises:
+            TimeoutError: If it is not ready within ``startup_wait_time`` seconds.
+        """
+        logger.info("Waiting up to %ds for CAD startup...", self.config.startup_wait_time)
+        started = time.monotonic()
+        deadline = started + self.config.startup_wait_time
+        while True:
+            try:
+                _ = self.app.Documents.Count
+                logger.info("CAD ready after %.1fs", time.monotonic() - started)
+                return
+            except Exception as e:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"CAD not ready after {self.config.startup_wait_time}s: {e}"
+                    ) from e
+                time.sleep(_STARTUP_POLL_INTERVAL)
+
+    def start(self, new_instance: bool = False) -> bool:
         """
         Start or connect to CAD application.
 
+        Args:
+            new_instance: Launch a private CAD process via ``DispatchEx``
+                instead of attaching to a running instance.
+
         Returns:
             True if connected successfully, False otherwise.
         """
         self._init_com()
 
-        import win32com.client
-
         cad_type = self.config.type.upper()
         app_id = CAD_APP_IDS.get(cad_type)
 
@@ -165,17 +402,26 @@ class CADController:
             return False
 
         # Try to connect to running instance first
-        try:
-            self.app = win32com.client.GetActiveObject(app_id)
+        running: Any = None
+        if not new_instance:
+            try:
+                running = win32com.client.GetActiveObject(app_id)
+            except Exception:
+                running = None
+
+        if running is not None:
+            self.app = self._early_bind(running)
             logger.info("Connected to running %s instance", cad_type)
-        except Exception:
+        else:
             # No running instance, start new one
             logger.info("Starting new %s instance...", cad_type)
             try:
-                self.app = win32com.client.Dispatch(app_id)
+                if new_instance:
+                    self.app = self._early_bind(win32com.client.DispatchEx(app_id))
+                else:
+                    self.app = self._early_bind(app_id)
                 self.app.Visible = True
-                logger.info("Waiting %ds for CAD startup...", self.config.startup_wait_time)
-                time.sleep(self.config.startup_wait_time)
+                self._wait_until_ready()
             except Exception as e:
                 logger.error("Failed to start %s: %s", cad_type, e)
                 return False
@@ -190,6 +436,9 @@ class CADController:
                 logger.info("Using active document: %s", self.doc.Name)
 
             self.model_space = self.doc.ModelSpace
+            self._bind_model_space_methods()
+            self._layer_names = None
+            self._prop_setter.reset()
             return True
 
         except Exception as e:
@@ -208,10 +457,27 @@ class CADController:
         except Exception:
             return False
 
-    def close(self) -> None:
-        """Close CAD connection and cleanup resources."""
+    def close(self, quit_app: bool = False) -> None:
+        """
+        Close CAD connection and cleanup resources.
+
+        Args:
+            quit_app: Also quit the CAD application, discarding unsaved
+                changes. Use for private instances started with
+                ``new_instance=True``, which would otherwise keep running.
+        """
+        if quit_app and self.app is not None:
+            try:
+                if self.doc is not None:
+                    self.doc.Close(False)
+                self.app.Quit()
+            except Exception as e:
+                logger.warning("Error quitting CAD application: %s", e)
         try:
+            self._unbind_model_space_methods()
             self.model_space = None
+            self._layer_names = None
+            self._prop_setter.reset()
             self.doc = None
             self.app = None
             logger.info("CAD connection closed")
@@ -220,8 +486,46 @@ class CADController:
         finally:
             self._cleanup_com()
 
+    @contextmanager
+    def batch(self) -> Iterator[CADController]:
+        """
+        Suppress per-entity view refreshes for the duration of the block.
+
+        REGENMODE is switched off while batching and the viewport is
+        regenerated exactly once on exit. Nested batches are flattened into
+        the outermost one.
+
+        Yields:
+            This controller.
+        """
+        if self._batching:
+            yield self
+            return
+
+        regen_mode: Any = None
+        if self.doc:
+            try:
+                regen_mode = self.doc.GetVariable("REGENMODE")
+                self.doc.SetVariable("REGENMODE", 0)
+            except Exception as e:
+                logger.debug("Could not disable REGENMODE: %s", e)
+
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            if self.doc and regen_mode is not None:
+                try:
+                    self.doc.SetVariable("REGENMODE", regen_mode)
+                except Exception as e:
+                    logger.warning("Failed to restore REGENMODE: %s", e)
+            self.refresh_view()
+
     def refresh_view(self) -> None:
-        """Refresh the CAD viewport."""
+        """Refresh the CAD viewport (deferred while batching)."""
+        if self._batching:
+            return
         if self.doc:
             try:
                 self.app.Update()
@@ -244,16 +548,22 @@ class CADController:
             return False
 
         try:
-            # Check if layer exists
-            layers = self.doc.Layers
-            for i in range(layers.Count):
-                if layers.Item(i).Name.lower() == name.lower():
-                    logger.debug("Layer '%s' already exists", name)
-                    return True
+            # Populate the layer cache once per document
+            if self._layer_names is None:
+                layers = self.doc.Layers
+                self._layer_names = {
+                    layers.Item(i).Name.lower() for i in range(layers.Count)
+                }
+
+            name_lower = name.lower()
+            if name_lower in self._layer_names:
+                logger.debug("Layer '%s' already exists", name)
+                return True
 
             # Create new layer
-            layer = layers.Add(name)
+            layer = self.doc.Layers.Add(name)
             layer.Color = color
+            self._layer_names.add(name_lower)
             logger.info("Created layer: %s", name)
             return True
 
@@ -270,26 +580,18 @@ class CADController:
     ) -> None:
         """Apply common properties to an entity."""
         try:
-            if layer:
-                self.create_layer(layer)
-                entity.Layer = layer
-
-            if color is not None:
-                entity.Color = color
-
-            if lineweight is not None:
-                entity.Lineweight = validate_lineweight(lineweight)
-
+            self._prop_setter.apply(entity, layer, color, lineweight)
         except Exception as e:
             logger.warning("Failed to apply entity properties: %s", e)
 
     def draw_line(
         self,
-        start: tuple[float, ...],
-        end: tuple[float, ...],
+        start: Sequence[float],
+        end: Sequence[float],
         layer: str | None = None,
         color: int | None = None,
         lineweight: int | None = None,
+        return_details: bool = True,
     ) -> dict[str, Any]:
         """
         Draw a line.
@@ -300,25 +602,29 @@ class CADController:
             layer: Optional layer name.
             color: Optional color index (0-255).
             lineweight: Optional lineweight value.
+            return_details: Include the input geometry in the result; batch
+                callers can pass False to get only success and type.
 
         Returns:
             Result dictionary with success status and entity info.
         """
         if not self.model_space:
-            return {"success": False, "error": "CAD not initialized"}
+            return dict(_NOT_INITIALIZED)
 
         try:
             start_3d = _ensure_3d_point(start)
             end_3d = _ensure_3d_point(end)
 
-            start_var = self._create_variant_array(list(start_3d))
-            end_var = self._create_variant_array(list(end_3d))
+            start_var = _variant_xyz(*start_3d)
+            end_var = _variant_xyz(*end_3d)
 
-            line = self.model_space.AddLine(start_var, end_var)
+            line = self._add_line(start_var, end_var)
             self._apply_entity_properties(line, layer, color, lineweight)
             self.refresh_view()
 
             logger.info("Drew line from %s to %s", start_3d, end_3d)
+            if not return_details:
+                return {"success": True, "type": "line"}
             return {
                 "success": True,
                 "type": "line",
@@ -330,13 +636,65 @@ class CADController:
             logger.error("Failed to draw line: %s", e)
             return {"success": False, "error": str(e)}
 
+    def draw_lines(
+        self,
+        starts: Sequence[Sequence[float]],
+        ends: Sequence[Sequence[float]],
+        layer: str | None = None,
+        color: int | None = None,
+        lineweight: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Draw many lines with a single view refresh.
+
+        Args:
+            starts: Start points, one per line.
+            ends: End points, parallel to ``starts``.
+            layer: Optional layer name applied to every line.
+            color: Optional color index (0-255).
+            lineweight: Optional lineweight value.
+
+        Returns:
+            Result dictionary with success status and number of lines drawn.
+        """
+        if not self.model_space:
+            return dict(_NOT_INITIALIZED)
+
+        if len(starts) != len(ends):
+            return {
+                "success": False,
+                "error": f"starts and ends differ in length ({len(starts)} != {len(ends)})",
+            }
+
+        count = 0
+        try:
+            with self.batch():
+                for start, end in zip(starts, ends, strict=True):
+                    start_var = _variant_xyz(*_ensure_3d_point(start))
+                    end_var = _variant_xyz(*_ensure_3d_point(end))
+                    line = self._add_line(start_var, end_var)
+                    self._apply_entity_properties(line, layer, color, lineweight)
+                    count += 1
+
+            logger.info("Drew %d lines", count)
+            return {
+                "success": True,
+                "type": "lines",
+                "count": count,
+            }
+
+        except Exception as e:
+            logger.error("Failed to draw lines after %d of %d: %s", count, len(starts), e)
+            return {"success": False, "error": str(e), "count": count}
+
     def draw_circle(
         self,
-        center: tuple[float, ...],
+        center: Sequence[float],
         radius: float,
         layer: str | None = None,
         color: int | None = None,
         lineweight: int | None = None,
+        return_details: bool = True,
     ) -> dict[str, Any]:
         """
         Draw a circle.
@@ -347,22 +705,26 @@ class CADController:
             layer: Optional layer name.
             color: Optional color index (0-255).
             lineweight: Optional lineweight value.
+            return_details: Include the input geometry in the result; batch
+                callers can pass False to get only success and type.
 
         Returns:
             Result dictionary with success status and entity info.
         """
         if not self.model_space:
-            return {"success": False, "error": "CAD not initialized"}
+            return dict(_NOT_INITIALIZED)
 
         try:
             center_3d = _ensure_3d_point(center)
-            center_var = self._create_variant_array(list(center_3d))
+            center_var = _variant_xyz(*center_3d)
 
-            circle = self.model_space.AddCircle(center_var, radius)
+            circle = self._add_circle(center_var, radius)
             self._apply_entity_properties(circle, layer, color, lineweight)
             self.refresh_view()
 
             logger.info("Drew circle at %s with radius %s", center_3d, radius)
+            if not return_details:
+                return {"success": True, "type": "circle"}
             return {
                 "success": True,
                 "type": "circle",
@@ -376,13 +738,14 @@ class CADController:
 
     def draw_arc(
         self,
-        center: tuple[float, ...],
+        center: Sequence[float],
         radius: float,
         start_angle: float,
         end_angle: float,
         layer: str | None = None,
         color: int | None = None,
         lineweight: int | None = None,
+        return_details: bool = True,
     ) -> dict[str, Any]:
         """
         Draw an arc.
@@ -395,24 +758,24 @@ class CADController:
             layer: Optional layer name.
             color: Optional color index (0-255).
             lineweight: Optional lineweight value.
+            return_details: Include the input geometry in the result; batch
+                callers can pass False to get only success and type.
 
         Returns:
             Result dictionary with success status and entity info.
         """
         if not self.model_space:
-            return {"success": False, "error": "CAD not initialized"}
+            return dict(_NOT_INITIALIZED)
 
         try:
-            import math
-
             center_3d = _ensure_3d_point(center)
-            center_var = self._create_variant_array(list(center_3d))
+            center_var = _variant_xyz(*center_3d)
 
             # Convert degrees to radians
             start_rad = math.radians(start_angle)
             end_rad = math.radians(end_angle)
 
-            arc = self.model_space.AddArc(center_var, radius, start_rad, end_rad)
+            arc = self._add_arc(center_var, radius, start_rad, end_rad)
             self._apply_entity_properties(arc, layer, color, lineweight)
             self.refresh_view()
 
@@ -420,6 +783,8 @@ class CADController:
                 "Drew arc at %s with radius %s from %s° to %s°",
                 center_3d, radius, start_angle, end_angle
             )
+            if not return_details:
+                return {"success": True, "type": "arc"}
             return {
                 "success": True,
                 "type": "arc",
@@ -435,13 +800,14 @@ class CADController:
 
     def draw_ellipse(
         self,
-        center: tuple[float, ...],
+        center: Sequence[float],
         major_axis: float,
         minor_axis: float,
         rotation: float = 0.0,
         layer: str | None = None,
         color: int | None = None,
         lineweight: int | None = None,
+        return_details: bool = True,
     ) -> dict[str, Any]:
         """
         Draw an ellipse.
@@ -454,35 +820,39 @@ class CADController:
             layer: Optional layer name.
             color: Optional color index (0-255).
             lineweight: Optional lineweight value.
+            return_details: Include the input geometry in the result; batch
+                callers can pass False to get only success and type.
 
         Returns:
             Result dictionary with success status and entity info.
         """
         if not self.model_space:
-            return {"success": False, "error": "CAD not initialized"}
+            return dict(_NOT_INITIALIZED)
 
         try:
-            import math
-
-            center_3d = _ensure_3d_point(center)
-            center_var = self._create_variant_array(list(center_3d))
-
+            # Inside the try: a non-numeric axis fails as a result, not a TypeError
             if major_axis <= 0:
                 return {"success": False, "error": f"major_axis must be positive, got {major_axis}"}
-            
+
             if minor_axis < 0:
-                return {"success": False, "error": f"minor_axis must be non-negative, got {minor_axis}"}
+                return {
+                    "success": False,
+                    "error": f"minor_axis must be non-negative, got {minor_axis}",
+                }
+
+            center_3d = _ensure_3d_point(center)
+            center_var = _variant_xyz(*center_3d)
 
             # Calculate major axis endpoint
             rotation_rad = math.radians(rotation)
-            major_x = major_axis * math.cos(rotation_rad)
-            major_y = major_axis * math.sin(rotation_rad)
-            major_axis_var = self._create_variant_array([major_x, major_y, 0.0])
+            major_axis_var = _variant_xyz(
+                major_axis * math.cos(rotation_rad), major_axis * math.sin(rotation_rad), 0.0
+            )
 
             # Ratio of minor to major axis (0-1)
-            ratio = min(1.0, minor_axis / major_axis) if major_axis > 0 else 0.0
+            ratio = min(1.0, minor_axis / major_axis)
 
-            ellipse = self.model_space.AddEllipse(center_var, major_axis_var, ratio)
+            ellipse = self._add_ellipse(center_var, major_axis_var, ratio)
             self._apply_entity_properties(ellipse, layer, color, lineweight)
             self.refresh_view()
 
@@ -490,6 +860,8 @@ class CADController:
                 "Drew ellipse at %s with axes %s/%s, rotation %s°",
                 center_3d, major_axis, minor_axis, rotation
             )
+            if not return_details:
+                return {"success": True, "type": "ellipse"}
             return {
                 "success": True,
                 "type": "ellipse",
@@ -503,69 +875,200 @@ class CADController:
             logger.error("Failed to draw ellipse: %s", e)
             return {"success": False, "error": str(e)}
 
+    def draw_ellipses(
+        self,
+        centers: Sequence[Sequence[float]],
+        major_axes: Sequence[float],
+        minor_axes: Sequence[float],
+        rotations: Sequence[float] | NDArray[np.float64] | None = None,
+        layer: str | None = None,
+        color: int | None = None,
+        lineweight: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Draw many ellipses with a single view refresh.
+
+        Args:
+            centers: Center points, one per ellipse.
+            major_axes: Major axis lengths, parallel to ``centers``.
+            minor_axes: Minor axis lengths, parallel to ``centers``.
+            rotations: Optional rotation angles in degrees. A NumPy array is
+                converted to direction cosines in one vectorized pass.
+            layer: Optional layer name applied to every ellipse.
+            color: Optional color index (0-255).
+            lineweight: Optional lineweight value.
+
+        Returns:
+            Result dictionary with success status and number of ellipses drawn.
+        """
+        if not self.model_space:
+            return dict(_NOT_INITIALIZED)
+
+        n = len(centers)
+        if len(major_axes) != n or len(minor_axes) != n or (
+            rotations is not None and len(rotations) != n
+        ):
+            return {"success": False, "error": "centers, axes and rotations must have equal length"}
+
+        count = 0
+        try:
+            # Inside the try: non-numeric input fails as a result, not a TypeError
+            for i, (major, minor) in enumerate(zip(major_axes, minor_axes, strict=True)):
+                if major <= 0:
+                    return {
+                        "success": False,
+                        "error": f"major_axis[{i}] must be positive, got {major}",
+                    }
+                if minor < 0:
+                    return {
+                        "success": False,
+                        "error": f"minor_axis[{i}] must be non-negative, got {minor}",
+                    }
+
+            # Direction of each major axis
+            if rotations is None:
+                cosines: list[float] = [1.0] * n
+                sines: list[float] = [0.0] * n
+            elif _is_ndarray(rotations):
+                import numpy as np
+
+                radians = np.radians(np.asarray(rotations, dtype=np.float64))
+                cosines = np.cos(radians).tolist()
+                sines = np.sin(radians).tolist()
+            else:
+                radians_list = [math.radians(r) for r in rotations]
+                cosines = [math.cos(r) for r in radians_list]
+                sines = [math.sin(r) for r in radians_list]
+
+            with self.batch():
+                for center, major, minor, cos_r, sin_r in zip(
+                    centers, major_axes, minor_axes, cosines, sines, strict=True
+                ):
+                    center_var = _variant_xyz(*_ensure_3d_point(center))
+                    major_axis_var = _variant_xyz(major * cos_r, major * sin_r, 0.0)
+                    ellipse = self._add_ellipse(center_var, major_axis_var, min(1.0, minor / major))
+                    self._apply_entity_properties(ellipse, layer, color, lineweight)
+                    count += 1
+
+            logger.info("Drew %d ellipses", count)
+            return {
+                "success": True,
+                "type": "ellipses",
+                "count": count,
+            }
+
+        except Exception as e:
+            logger.error("Failed to draw ellipses after %d of %d: %s", count, n, e)
+            return {"success": False, "error": str(e), "count": count}
+
     def draw_polyline(
         self,
-        points: list[tuple[float, ...]],
+        points: Sequence[Sequence[float]] | NDArray[np.float64],
         closed: bool = False,
         layer: str | None = None,
         color: int | None = None,
         lineweight: int | None = None,
+        force_3d: bool = False,
+        return_details: bool = True,
     ) -> dict[str, Any]:
         """
         Draw a polyline.
 
+        Planar polylines (all points sharing one z) are created as
+        lightweight polylines, which take half the coordinate data.
+
         Args:
-            points: List of points [(x1, y1), (x2, y2), ...].
+            points: List of points [(x1, y1), (x2, y2), ...], or a NumPy
+                array of shape (N, 2) or (N, 3).
             closed: Whether to close the polyline.
             layer: Optional layer name.
             color: Optional color index (0-255).
             lineweight: Optional lineweight value.
+            force_3d: Skip the lightweight polyline and always use
+                AddPolyline, which creates a (heavy) 2D polyline, not a
+                3D polyline.
+            return_details: Include the input geometry in the result; batch
+                callers can pass False to get only success and type.
 
         Returns:
             Result dictionary with success status and entity info.
         """
+        result, _ = self._draw_polyline_entity(
+            points, closed, layer, color, lineweight, force_3d, return_details
+        )
+        return result
+
+    def _draw_polyline_entity(
+        self,
+        points: Sequence[Sequence[float]] | NDArray[np.float64],
+        closed: bool = False,
+        layer: str | None = None,
+        color: int | None = None,
+        lineweight: int | None = None,
+        force_3d: bool = False,
+        return_details: bool = True,
+    ) -> tuple[dict[str, Any], Any]:
+        """Draw a polyline and return the result with the created COM entity (None on failure)."""
         if not self.model_space:
-            return {"success": False, "error": "CAD not initialized"}
+            return dict(_NOT_INITIALIZED), None
 
         if len(points) < 2:
-            return {"success": False, "error": "Polyline requires at least 2 points"}
+            return {"success": False, "error": "Polyline requires at least 2 points"}, None
 
         try:
-            # Flatten points to array [x1, y1, z1, x2, y2, z2, ...]
-            flat_points: list[float] = []
-            points_3d = []
-            for pt in points:
-                pt_3d = _ensure_3d_point(pt)
-                points_3d.append(pt_3d)
-                flat_points.extend(pt_3d)
-
-            points_var = self._create_variant_array(flat_points)
-
-            polyline = self.model_space.AddPolyline(points_var)
+            # Flatten points to [x1, y1, x2, y2, ...] when planar, else [x1, y1, z1, ...]
+            elevation: float | None
+            if _is_ndarray(points):
+                flat_points, points_3d, elevation = _flatten_ndarray_points(
+                    cast("NDArray[np.float64]", points), allow_2d=not force_3d
+                )
+                points_var = self._create_variant_array(flat_points)
+            else:
+                points_3d = [_ensure_3d_point(pt) for pt in points]
+                elevation = points_3d[0][2]
+                if not force_3d and all(pt[2] == elevation for pt in points_3d):
+                    points_var = self._create_variant_array(
+                        coord for x, y, _ in points_3d for coord in (x, y)
+                    )
+                else:
+                    elevation = None
+                    points_var = self._create_variant_array(
+                        coord for pt in points_3d for coord in pt
+                    )
+
+            if elevation is None:
+                polyline = self._add_polyline(points_var)
+            else:
+                polyline = self._add_lw_polyline(points_var)
+                if elevation:
+                    polyline.Elevation = elevation
             if closed:
                 polyline.Closed = True
             self._apply_entity_properties(polyline, layer, color, lineweight)
             self.refresh_view()
 
             logger.info("Drew polyline with %d points, closed=%s", len(points), closed)
+            if not return_details:
+                return {"success": True, "type": "polyline"}, polyline
             return {
                 "success": True,
                 "type": "polyline",
                 "points": points_3d,
                 "closed": closed,
-            }
+            }, polyline
 
         except Exception as e:
             logger.error("Failed to draw polyline: %s", e)
-            return {"success": False, "error": str(e)}
+            return {"success": False, "error": str(e)}, None
 
     def draw_rectangle(
         self,
-        corner1: tuple[float, ...],
-        corner2: tuple[float, ...],
+        corner1: Sequence[float],
+        corner2: Sequence[float],
         layer: str | None = None,
         color: int | None = None,
         lineweight: int | None = None,
+        return_details: bool = True,
     ) -> dict[str, Any]:
         """
         Draw a rectangle.
@@ -576,6 +1079,8 @@ class CADController:
             layer: Optional layer name.
             color: Optional color index (0-255).
             lineweight: Optional lineweight value.
+            return_details: Include the input geometry in the result; batch
+                callers can pass False to get only success and type.
 
         Returns:
             Result dictionary with success status and entity info.
@@ -591,22 +1096,27 @@ class CADController:
             (c1[0], c2[1], c2[2]),
         ]
 
-        result = self.draw_polyline(points, closed=True, layer=layer, color=color, lineweight=lineweight)
+        result = self.draw_polyline(
+            points, closed=True, layer=layer, color=color, lineweight=lineweight,
+            return_details=return_details,
+        )
         if result["success"]:
             result["type"] = "rectangle"
-            result["corner1"] = c1
-            result["corner2"] = c2
+            if return_details:
+                result["corner1"] = c1
+                result["corner2"] = c2
             logger.info("Drew rectangle from %s to %s", c1, c2)
         return result
 
     def draw_text(
         self,
-        position: tuple[float, ...],
+        position: Sequence[float],
         text: str,
         height: float = 2.5,
         rotation: float = 0.0,
         layer: str | None = None,
         color: int | None = None,
+        return_details: bool = True,
     ) -> dict[str, Any]:
         """
         Draw text.
@@ -618,25 +1128,27 @@ class CADController:
             rotation: Rotation angle in degrees.
             layer: Optional layer name.
             color: Optional color index (0-255).
+            return_details: Include the input geometry in the result; batch
+                callers can pass False to get only success and type.
 
         Returns:
             Result dictionary with success status and entity info.
         """
         if not self.model_space:
-            return {"success": False, "error": "CAD not initialized"}
+            return dict(_NOT_INITIALIZED)
 
         try:
-            import math
-
             position_3d = _ensure_3d_point(position)
-            position_var = self._create_variant_array(list(position_3d))
+            position_var = _variant_xyz(*position_3d)
 
-            text_entity = self.model_space.AddText(text, position_var, height)
+            text_entity = self._add_text(text, position_var, height)
             text_entity.Rotation = math.radians(rotation)
             self._apply_entity_properties(text_entity, layer, color)
             self.refresh_view()
 
             logger.info("Drew text '%s' at %s", text, position_3d)
+            if not return_details:
+                return {"success": True, "type": "text"}
             return {
                 "success": True,
                 "type": "text",
@@ -652,11 +1164,12 @@ class CADController:
 
     def draw_hatch(
         self,
-        boundary_points: list[tuple[float, ...]],
+        boundary_points: Sequence[Sequence[float]],
         pattern_name: str = "SOLID",
         pattern_scale: float = 1.0,
         layer: str | None = None,
         color: int | None = None,
+        return_details: bool = True,
     ) -> dict[str, Any]:
         """
         Draw a hatch pattern.
@@ -667,46 +1180,50 @@ class CADController:
             pattern_scale: Pattern scale factor.
             layer: Optional layer name.
             color: Optional color index (0-255).
+            return_details: Include the input geometry in the result; batch
+                callers can pass False to get only success and type.
 
         Returns:
             Result dictionary with success status and entity info.
         """
         if not self.model_space:
-            return {"success": False, "error": "CAD not initialized"}
+            return dict(_NOT_INITIALIZED)
 
         if len(boundary_points) < 3:
             return {"success": False, "error": "Hatch requires at least 3 boundary points"}
 
         try:
             # First create a closed polyline as boundary
-            boundary_result = self.draw_polyline(boundary_points, closed=True)
+            boundary_result, polyline = self._draw_polyline_entity(
+                boundary_points, closed=True, return_details=False
+            )
             if not boundary_result["success"]:
                 return boundary_result
 
-            # Get the polyline reference immediately after creation
-            polyline = self.model_space.Item(self.model_space.Count - 1)
-
             # Create hatch
             # PatternType: 0=User-defined (for SOLID), 1=Predefined, 2=Custom
             # Use 0 for SOLID and other user patterns, 1 for predefined patterns like ANSI31
             pattern_type = 1 if pattern_name.upper() != "SOLID" else 0
-            hatch = self.model_space.AddHatch(pattern_type, pattern_name, True)
+            hatch = self._add_hatch(pattern_type, pattern_name, True)
             hatch.PatternScale = pattern_scale
 
             # Create outer loop from polyline - must use proper COM array format
-            import pythoncom
-            import win32com.client
-            outer_array = win32com.client.VARIANT(
-                pythoncom.VT_ARRAY | pythoncom.VT_DISPATCH,
-                [polyline]
-            )
-            hatch.AppendOuterLoop(outer_array)
+            if self._loop_variant is None:
+                self._loop_variant = win32com.client.VARIANT(_VT_ARRAY_DISPATCH, ())
+            self._loop_variant.value = (polyline,)
+            try:
+                hatch.AppendOuterLoop(self._loop_variant)
+            finally:
+                # Do not keep the boundary entity alive between calls
+                self._loop_variant.value = ()
 
             hatch.Evaluate()
             self._apply_entity_properties(hatch, layer, color)
             self.refresh_view()
 
             logger.info("Drew hatch with pattern '%s' at scale %s", pattern_name, pattern_scale)
+            if not return_details:
+                return {"success": True, "type": "hatch"}
             return {
                 "success": True,
                 "type": "hatch",
@@ -720,11 +1237,12 @@ class CADController:
 
     def add_dimension(
         self,
-        start: tuple[float, ...],
-        end: tuple[float, ...],
-        text_position: tuple[float, ...],
+        start: Sequence[float],
+        end: Sequence[float],
+        text_position: Sequence[float],
         layer: str | None = None,
         color: int | None = None,
+        return_details: bool = True,
     ) -> dict[str, Any]:
         """
         Add a linear dimension.
@@ -735,33 +1253,36 @@ class CADController:
             text_position: Position for dimension text.
             layer: Optional layer name.
             color: Optional color index (0-255).
+            return_details: Include the input geometry in the result; batch
+                callers can pass False to get only success and type.
 
         Returns:
             Result dictionary with success status and entity info.
         """
         if not self.model_space:
-            return {"success": False, "error": "CAD not initialized"}
+            return dict(_NOT_INITIALIZED)
 
         try:
             start_3d = _ensure_3d_point(start)
             end_3d = _ensure_3d_point(end)
             text_pos_3d = _ensure_3d_point(text_position)
 
-            start_var = self._create_variant_array(list(start_3d))
-            end_var = self._create_variant_array(list(end_3d))
-            text_var = self._create_variant_array(list(text_pos_3d))
+            start_var = _variant_xyz(*start_3d)
+            end_var = _variant_xyz(*end_3d)
+            text_var = _variant_xyz(*text_pos_3d)
 
             # Calculate rotation angle (0 for horizontal, pi/2 for vertical)
-            import math
             dx = end_3d[0] - start_3d[0]
             dy = end_3d[1] - start_3d[1]
             rotation = math.atan2(dy, dx)
 
-            dim = self.model_space.AddDimAligned(start_var, end_var, text_var)
+            dim = self._add_dim_aligned(start_var, end_var, text_var)
             self._apply_entity_properties(dim, layer, color)
             self.refresh_view()
 
             logger.info("Added dimension from %s to %s", start_3d, end_3d)
+            if not return_details:
+                return {"success": True, "type": "dimension"}
             return {
                 "success": True,
                 "type": "dimension",
@@ -788,23 +1309,29 @@ class CADController:
             return {"success": False, "error": "No document to save"}
 
         try:
-            from pathlib import Path
-
             # Ensure directory exists
-            path = Path(file_path)
+            path = Path(file_path).absolute()
             path.parent.mkdir(parents=True, exist_ok=True)
+            saved_path = str(path)
 
-            self.doc.SaveAs(str(path.absolute()))
-            logger.info("Saved drawing to %s", file_path)
+            self.doc.SaveAs(saved_path)
+            logger.info("Saved drawing to %s", saved_path)
             return {
                 "success": True,
-                "file_path": str(path.absolute()),
+                "file_path": saved_path,
             }
 
         except Exception as e:
             logger.error("Failed to save drawing: %s", e)
             return {"success": False, "error": str(e)}
 
-    def __del__(self) -> None:
-        """Cleanup on destruction."""
+    def __enter__(self) -> CADController:
+        """Start the CAD connection for a ``with`` block."""
+        if not self.start():
+            self.close()
+            raise RuntimeError(f"Failed to start {self.config.type}")
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the CAD connection at the end of a ``with`` block."""
         self.close()
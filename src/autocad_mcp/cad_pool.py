@@ -0,0 +1,103 @@
+"""
+Process pool of independent CAD instances.
+
+COM objects are apartment-threaded and cannot be shared across threads, so
+parallel drawing work runs in separate processes, each owning its own CAD
+application launched via ``DispatchEx``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from autocad_mcp.cad_controller import _NOT_INITIALIZED, CADController
+from autocad_mcp.config import CADConfig
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+# A unit of work: (controller method name, positional args, keyword args)
+CADTask = tuple[str, tuple[Any, ...], dict[str, Any]]
+
+
+def _worker(tasks: list[CADTask], config_dict: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Run a chunk of tasks against a private CAD instance.
+
+    Args:
+        tasks: Tasks to execute in order.
+        config_dict: CAD configuration as a plain dictionary.
+
+    Returns:
+        One result dictionary per task.
+    """
+    controller = CADController(CADConfig(**config_dict))
+    # Quit the private CAD process on every exit path, or each map() call
+    # would leave up to max_workers instances running
+    if not controller.start(new_instance=True):
+        controller.close(quit_app=True)
+        return [dict(_NOT_INITIALIZED) for _ in tasks]
+
+    results: list[dict[str, Any]] = []
+    try:
+        with controller.batch():
+            for method_name, args, kwargs in tasks:
+                method = getattr(controller, method_name, None)
+                if method_name.startswith("_") or not callable(method):
+                    results.append({"success": False, "error": f"Unknown method: {method_name}"})
+                    continue
+                results.append(method(*args, **kwargs))
+    finally:
+        controller.close(quit_app=True)
+
+    return results
+
+
+class ParallelCADPool:
+    """
+    Distribute drawing tasks across several CAD processes.
+
+    Each worker draws into its own CAD instance and document, so a chunk of
+    tasks that must end up in one drawing should finish with a
+    ``save_drawing`` task.
+    """
+
+    def __init__(self, config: CADConfig, max_workers: int | None = None) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            config: CAD configuration used by every worker.
+            max_workers: Number of worker processes (defaults to CPU count).
+        """
+        self.config = config
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def map(self, tasks: Sequence[CADTask]) -> list[dict[str, Any]]:
+        """
+        Execute tasks in parallel, one contiguous chunk per worker.
+
+        Args:
+            tasks: Tasks such as ``("draw_line", ((0, 0), (10, 10)), {})``.
+
+        Returns:
+            Result dictionaries in the same order as ``tasks``.
+        """
+        if not tasks:
+            return []
+
+        workers = min(self.max_workers, len(tasks))
+        chunk_size = -(-len(tasks) // workers)
+        chunks = [list(tasks[i:i + chunk_size]) for i in range(0, len(tasks), chunk_size)]
+        config_dict = asdict(self.config)
+
+        logger.info("Dispatching %d tasks to %d CAD workers", len(tasks), len(chunks))
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            chunk_results = executor.map(_worker, chunks, [config_dict] * len(chunks))
+            return [result for chunk in chunk_results for result in chunk]
@@ -7,16 +7,41 @@ Supports both English and Chinese command syntax.
 
 from __future__ import annotations
 
+import functools
+import importlib
 import logging
 import re
+import sys
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar, Generic, TypeVar
+
+# Loaded dynamically and typed as Any, so type checking and the mypyc build
+# neither need regex's stubs nor trip over the None fallback
+_regex: Any
+try:
+    _regex = importlib.import_module("regex")
+except ImportError:  # optional accelerator, see the "regex" extra
+    _regex = None
 
 logger = logging.getLogger(__name__)
 
+_V = TypeVar("_V")
+
+
+def _frozen_keywords(keywords: dict[str, _V]) -> Mapping[str, _V]:
+    """
+    Return a read-only view of a keyword table with interned keys.
+
+    Keys are lowercased here, once, because all matching is done against
+    lowercased command text.
+    """
+    return MappingProxyType({sys.intern(k.lower()): v for k, v in keywords.items()})
+
 
 # Color name to CAD color index mapping
-COLOR_MAP: dict[str, int] = {
+COLOR_MAP: Mapping[str, int] = _frozen_keywords({
     # English
     "red": 1,
     "yellow": 2,
@@ -81,10 +106,10 @@ COLOR_MAP: dict[str, int] = {
     "粉": 221,
     "粉色": 221,
     "粉红": 221,
-}
+})
 
 # Shape keywords (English, Italian, and Chinese)
-SHAPE_KEYWORDS: dict[str, str] = {
+SHAPE_KEYWORDS: Mapping[str, str] = _frozen_keywords({
     # English
     "line": "line",
     "circle": "circle",
@@ -134,10 +159,10 @@ SHAPE_KEYWORDS: dict[str, str] = {
     "尺寸": "dimension",
     "填充": "hatch",
     "图案填充": "hatch",
-}
+})
 
 # Action keywords (English, Italian, and Chinese)
-ACTION_KEYWORDS: dict[str, str] = {
+ACTION_KEYWORDS: Mapping[str, str] = _frozen_keywords({
     # English
     "draw": "draw",
     "create": "draw",
@@ -189,16 +214,160 @@ ACTION_KEYWORDS: dict[str, str] = {
     "移除": "erase",
     "擦除": "erase",
     "保存": "save",
+})
+
+
+# Shared regex fragments: unsigned and signed numbers, a keyword/value
+# separator, and an optionally parenthesized "x, y" pair. Matched numbers
+# are always converted with float(): on CPython it is cheaper than int()
+# even for integer literals, and it keeps parameter types uniform.
+_NUM = r"(\d+\.?\d*)"
+_SIGNED_NUM = r"(-?\d+\.?\d*)"
+_KV = r"\s*[=:]?\s*"
+_COORD = rf"\(?\s*{_SIGNED_NUM}\s*,\s*{_SIGNED_NUM}\s*\)?"
+# A hatch pattern name, which must not be another parameter's keyword: in
+# "pattern scale 2" the scale belongs to its own group, not to the pattern
+_PATTERN_NAME = (
+    r"(?!(?:radius|start|end|major|minor|rotation|width|height|scale)(?![a-z]))"
+    r"(\w+)"
+)
+
+# Keyword/value parameters, scanned in a single pass over the command.
+# Each alternative is one named group wrapping an unnamed value group;
+# English and Chinese keywords for a parameter share the same group. The
+# value is converted once while scanning, so parsers only pick defaults.
+_PARAM_PATTERNS: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("radius", rf"(?:radius|半径){_KV}{_NUM}", float),
+    ("start_angle", rf"(?:start\s*(?:angle)?|起始角){_KV}{_NUM}", float),
+    ("end_angle", rf"(?:end\s*(?:angle)?|终止角){_KV}{_NUM}", float),
+    ("major", rf"major\s*(?:axis)?{_KV}{_NUM}", float),
+    ("minor", rf"minor\s*(?:axis)?{_KV}{_NUM}", float),
+    ("rotation", rf"rotation{_KV}{_NUM}", float),
+    ("width", rf"(?:width|宽){_KV}{_NUM}", float),
+    ("height", rf"(?:height|高度?){_KV}{_NUM}", float),
+    ("pattern", rf"pattern{_KV}{_PATTERN_NAME}", str.upper),
+    ("scale", rf"scale{_KV}{_NUM}", float),
+)
+_PARAM_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    name: convert for name, _, convert in _PARAM_PATTERNS
 }
+# Matched against lowercased text, so no re.IGNORECASE is needed
+_PARAM_SCANNER = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _PARAM_PATTERNS)
+)
+
+_DWG_RE = re.compile(r"(\S+\.dwg)", re.IGNORECASE)
+
+# A coordinate pair, or failing that a standalone number
+_COORD_OR_NUMBER_RE = re.compile(f"{_COORD}|{_SIGNED_NUM}")
+
+# Cheap precheck that lets number extraction bail out on digit-free text
+_has_digit = re.compile(r"\d").search
+
+# Separators used to split text into candidate whole-word keywords
+_TOKEN_SPLIT_RE = re.compile(r"[\s,.;:!?()\[\]\"'=]+")
+
+# Shared parameters of commands without a recognized shape
+_EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+# Number of distinct command strings whose parse results are memoized
+_PARSE_CACHE_SIZE = 1024
+
+
+def _scan_params(text_lower: str) -> dict[str, Any]:
+    """
+    Extract keyword/value parameters from text in one pass.
+
+    Args:
+        text_lower: Lowercased command text.
+
+    Returns:
+        Mapping of parameter name to the converted value of its first
+        occurrence.
+    """
+    found: dict[str, Any] = {}
+    for match in _PARAM_SCANNER.finditer(text_lower):
+        name = match.lastgroup
+        if name is not None and name not in found:
+            value = match.group(match.lastindex + 1)  # type: ignore[operator]
+            found[name] = _PARAM_CONVERTERS[name](value)
+    return found
+
+
+def _scan_numbers(text: str) -> tuple[list[tuple[float, float]], list[float]]:
+    """
+    Split the numbers in text into coordinate pairs and standalone values.
+
+    Args:
+        text: Command text.
+
+    Returns:
+        Tuple of (coordinate pairs, numbers that are not part of a pair).
+    """
+    coords: list[tuple[float, float]] = []
+    numbers: list[float] = []
+    if not _has_digit(text):
+        return coords, numbers
+    # findall yields "" for the groups of the alternative that did not match
+    for x, y, number in _COORD_OR_NUMBER_RE.findall(text):
+        if number:
+            numbers.append(float(number))
+        else:
+            coords.append((float(x), float(y)))
+    return coords, numbers
+
+
+class _KeywordMatcher(Generic[_V]):
+    """
+    Single-pass multi-keyword matcher.
+
+    ASCII keywords are first probed as whole words with one dict lookup per
+    token. Otherwise all keywords are compiled into one alternation, longest
+    first, so a search walks the text once and returns the leftmost, longest
+    keyword (e.g. "polyline" rather than the "line" it contains). CJK
+    keywords are not whitespace-delimited and always go through the
+    alternation, which is compiled with the regex module when installed.
+    """
+
+    def __init__(self, keywords: Mapping[str, _V]) -> None:
+        self._keywords = keywords
+        self._words = {k: v for k, v in keywords.items() if k.isascii()}
+        ordered = sorted(keywords, key=len, reverse=True)
+        alternation = "|".join(re.escape(k) for k in ordered)
+        # Atomic group: once a keyword matches, never retry shorter ones
+        if _regex is not None:
+            self._pattern = _regex.compile(f"(?>{alternation})")
+        elif sys.version_info >= (3, 11):
+            self._pattern = re.compile(f"(?>{alternation})")
+        else:
+            self._pattern = re.compile(alternation)
+
+    def find(self, text_lower: str) -> _V | None:
+        """Return the value of the first keyword found in lowercased text."""
+        words = self._words
+        for token in _TOKEN_SPLIT_RE.split(text_lower):
+            value = words.get(token)
+            if value is not None:
+                return value
+
+        match = self._pattern.search(text_lower)
+        if match:
+            return self._keywords[match.group()]
+        return None
+
+
+_ACTION_MATCHER: _KeywordMatcher[str] = _KeywordMatcher(ACTION_KEYWORDS)
+_SHAPE_MATCHER: _KeywordMatcher[str] = _KeywordMatcher(SHAPE_KEYWORDS)
+_COLOR_MATCHER: _KeywordMatcher[int] = _KeywordMatcher(COLOR_MAP)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedCommand:
     """Parsed command result."""
 
     action: str
     shape: str | None = None
-    parameters: dict[str, Any] = field(default_factory=dict)
+    parameters: Mapping[str, Any] = field(default_factory=dict)
     raw_text: str = ""
     confidence: float = 0.0
 
@@ -207,20 +376,29 @@ class NLPProcessor:
     """Natural language processor for CAD commands."""
 
     # Regex patterns
-    COORD_PATTERN = re.compile(r"\(?\s*(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)\s*\)?")
-    NUMBER_PATTERN = re.compile(r"(-?\d+\.?\d*)")
-    QUOTED_TEXT_PATTERN = re.compile(r'["\']([^"\']+)["\']|"([^"]+)"|「([^」]+)」')
+    COORD_PATTERN: ClassVar[re.Pattern[str]] = re.compile(_COORD)
+    NUMBER_PATTERN: ClassVar[re.Pattern[str]] = re.compile(_SIGNED_NUM)
+    QUOTED_TEXT_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r'["\']([^"\']+)["\']|"([^"]+)"|「([^」]+)」')
 
     def __init__(self) -> None:
         """Initialize NLP processor."""
-        self._color_pattern = self._build_color_pattern()
-
-    def _build_color_pattern(self) -> re.Pattern[str]:
-        """Build regex pattern for color matching."""
-        # Sort by length (longest first) to match longer names first
-        colors = sorted(COLOR_MAP.keys(), key=len, reverse=True)
-        pattern = "|".join(re.escape(c) for c in colors)
-        return re.compile(pattern, re.IGNORECASE)
+        self._parsers: dict[str, Callable[[str, dict[str, Any]], dict[str, Any]]] = {
+            "line": self._parse_line,
+            "circle": self._parse_circle,
+            "arc": self._parse_arc,
+            "ellipse": self._parse_ellipse,
+            "rectangle": self._parse_rectangle,
+            "polyline": self._parse_polyline,
+            "text": self._parse_text,
+            "dimension": self._parse_dimension,
+            "hatch": self._parse_hatch,
+            "save": self._parse_save,
+        }
+        # Parsing is a pure function of the text, so repeated commands are
+        # served from a per-instance cache
+        self._parse_cached = functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)(
+            self._parse_uncached
+        )
 
     def extract_color(self, text: str) -> int | None:
         """
@@ -232,11 +410,7 @@ class NLPProcessor:
         Returns:
             CAD color index or None if no color found.
         """
-        match = self._color_pattern.search(text)
-        if match:
-            color_name = match.group().lower()
-            return COLOR_MAP.get(color_name)
-        return None
+        return _COLOR_MATCHER.find(text.lower())
 
     def extract_coordinates(self, text: str) -> list[tuple[float, float]]:
         """
@@ -248,12 +422,9 @@ class NLPProcessor:
         Returns:
             List of (x, y) coordinate tuples.
         """
-        coords = []
-        for match in self.COORD_PATTERN.finditer(text):
-            x = float(match.group(1))
-            y = float(match.group(2))
-            coords.append((x, y))
-        return coords
+        if not _has_digit(text):
+            return []
+        return [(float(x), float(y)) for x, y in self.COORD_PATTERN.findall(text)]
 
     def extract_numbers(self, text: str) -> list[float]:
         """
@@ -265,7 +436,9 @@ class NLPProcessor:
         Returns:
             List of extracted numbers.
         """
-        return [float(m.group(1)) for m in self.NUMBER_PATTERN.finditer(text)]
+        if not _has_digit(text):
+            return []
+        return list(map(float, self.NUMBER_PATTERN.findall(text)))
 
     def extract_quoted_text(self, text: str) -> str | None:
         """
@@ -293,11 +466,7 @@ class NLPProcessor:
         Returns:
             Normalized action name or None.
         """
-        text_lower = text.lower()
-        for keyword, action in ACTION_KEYWORDS.items():
-            if keyword.lower() in text_lower:
-                return action
-        return None
+        return _ACTION_MATCHER.find(text.lower())
 
     def identify_shape(self, text: str) -> str | None:
         """
@@ -309,11 +478,7 @@ class NLPProcessor:
         Returns:
             Normalized shape name or None.
         """
-        text_lower = text.lower()
-        for keyword, shape in SHAPE_KEYWORDS.items():
-            if keyword.lower() in text_lower:
-                return shape
-        return None
+        return _SHAPE_MATCHER.find(text.lower())
 
     def parse_command(self, text: str) -> ParsedCommand:
         """
@@ -323,39 +488,52 @@ class NLPProcessor:
             text: Natural language command text.
 
         Returns:
-            ParsedCommand with extracted information.
+            ParsedCommand with extracted information. Results are cached and
+            shared between calls with the same text, so their parameters are
+            read-only.
         """
-        action = self.identify_action(text) or "draw"
-        shape = self.identify_shape(text)
+        return self._parse_cached(text)
+
+    def _parse_uncached(self, text: str) -> ParsedCommand:
+        """Parse a command without consulting the result cache."""
+        # Lowercase once; keyword, color and parameter matching all use it
+        text_lower = text.lower()
+        action = _ACTION_MATCHER.find(text_lower) or "draw"
+        shape = _SHAPE_MATCHER.find(text_lower)
 
         if not shape:
             return ParsedCommand(
                 action=action,
+                parameters=_EMPTY_PARAMS,
                 raw_text=text,
                 confidence=0.3,
             )
 
         # Dispatch to specific parser
-        parser_method = getattr(self, f"_parse_{shape}", None)
-        if parser_method:
-            params = parser_method(text)
-        else:
-            params = self._parse_generic(text)
+        kv = _scan_params(text_lower)
+        parser = self._parsers.get(shape, self._parse_generic)
+        params = parser(text, kv)
 
         # Add color if found
-        color = self.extract_color(text)
+        color = _COLOR_MATCHER.find(text_lower)
         if color is not None:
             params["color"] = color
 
+        # Results are cached and shared, so hand out read-only parameters:
+        # point lists become tuples and the mapping itself is a proxy
+        frozen = {
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in params.items()
+        }
         return ParsedCommand(
             action=action,
             shape=shape,
-            parameters=params,
+            parameters=MappingProxyType(frozen),
             raw_text=text,
             confidence=0.8 if params else 0.5,
         )
 
-    def _parse_generic(self, text: str) -> dict[str, Any]:
+    def _parse_generic(self, text: str, kv: dict[str, Any]) -> dict[str, Any]:
         """Generic parameter extraction."""
         params: dict[str, Any] = {}
         coords = self.extract_coordinates(text)
@@ -363,7 +541,7 @@ class NLPProcessor:
             params["points"] = coords
         return params
 
-    def _parse_line(self, text: str) -> dict[str, Any]:
+    def _parse_line(self, text: str, kv: dict[str, Any]) -> dict[str, Any]:
         """Parse line command parameters."""
         coords = self.extract_coordinates(text)
 
@@ -380,10 +558,9 @@ class NLPProcessor:
             "end": (100, 100),
         }
 
-    def _parse_circle(self, text: str) -> dict[str, Any]:
+    def _parse_circle(self, text: str, kv: dict[str, Any]) -> dict[str, Any]:
         """Parse circle command parameters."""
-        coords = self.extract_coordinates(text)
-        numbers = self.extract_numbers(text)
+        coords, numbers = _scan_numbers(text)
 
         params: dict[str, Any] = {}
 
@@ -394,95 +571,45 @@ class NLPProcessor:
             params["center"] = (0, 0)
 
         # Extract radius - look for explicit "radius" keyword
-        radius_match = re.search(r"radius\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if not radius_match:
-            radius_match = re.search(r"半径\s*[=:]?\s*(\d+\.?\d*)", text)
-
-        if radius_match:
-            params["radius"] = float(radius_match.group(1))
-        elif coords and len(numbers) > 2:
-            # Filter out coordinate numbers (2 per coordinate) and use remaining as radius
-            coord_numbers = len(coords) * 2
-            remaining_numbers = numbers[coord_numbers:]
-            if remaining_numbers:
-                params["radius"] = remaining_numbers[0]
-            else:
-                params["radius"] = 50
-        elif not coords and numbers:
-            # No coordinates, use first number as radius
+        if "radius" in kv:
+            params["radius"] = kv["radius"]
+        elif numbers:
+            # Use the first number that is not part of a coordinate pair
             params["radius"] = numbers[0]
         else:
             params["radius"] = 50
 
         return params
 
-    def _parse_arc(self, text: str) -> dict[str, Any]:
+    def _parse_arc(self, text: str, kv: dict[str, Any]) -> dict[str, Any]:
         """Parse arc command parameters."""
         coords = self.extract_coordinates(text)
-        numbers = self.extract_numbers(text)
 
         params: dict[str, Any] = {
             "center": coords[0] if coords else (0, 0),
-            "radius": 50,
-            "start_angle": 0,
-            "end_angle": 90,
+            "radius": kv.get("radius", 50),
+            "start_angle": kv.get("start_angle", 0),
+            "end_angle": kv.get("end_angle", 90),
         }
 
-        # Look for specific parameters
-        radius_match = re.search(r"radius\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if radius_match:
-            params["radius"] = float(radius_match.group(1))
-
-        start_match = re.search(r"start\s*(?:angle)?\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if start_match:
-            params["start_angle"] = float(start_match.group(1))
-
-        end_match = re.search(r"end\s*(?:angle)?\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if end_match:
-            params["end_angle"] = float(end_match.group(1))
-
-        # Chinese angle patterns
-        start_cn = re.search(r"起始角\s*[=:]?\s*(\d+\.?\d*)", text)
-        if start_cn:
-            params["start_angle"] = float(start_cn.group(1))
-
-        end_cn = re.search(r"终止角\s*[=:]?\s*(\d+\.?\d*)", text)
-        if end_cn:
-            params["end_angle"] = float(end_cn.group(1))
-
         return params
 
-    def _parse_ellipse(self, text: str) -> dict[str, Any]:
+    def _parse_ellipse(self, text: str, kv: dict[str, Any]) -> dict[str, Any]:
         """Parse ellipse command parameters."""
         coords = self.extract_coordinates(text)
-        numbers = self.extract_numbers(text)
 
         params: dict[str, Any] = {
             "center": coords[0] if coords else (0, 0),
-            "major_axis": 100,
-            "minor_axis": 50,
-            "rotation": 0,
+            "major_axis": kv.get("major", 100),
+            "minor_axis": kv.get("minor", 50),
+            "rotation": kv.get("rotation", 0),
         }
 
-        # Look for axis lengths
-        major_match = re.search(r"major\s*(?:axis)?\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if major_match:
-            params["major_axis"] = float(major_match.group(1))
-
-        minor_match = re.search(r"minor\s*(?:axis)?\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if minor_match:
-            params["minor_axis"] = float(minor_match.group(1))
-
-        rotation_match = re.search(r"rotation\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if rotation_match:
-            params["rotation"] = float(rotation_match.group(1))
-
         return params
 
-    def _parse_rectangle(self, text: str) -> dict[str, Any]:
+    def _parse_rectangle(self, text: str, kv: dict[str, Any]) -> dict[str, Any]:
         """Parse rectangle command parameters."""
         coords = self.extract_coordinates(text)
-        numbers = self.extract_numbers(text)
 
         if len(coords) >= 2:
             return {
@@ -490,33 +617,13 @@ class NLPProcessor:
                 "corner2": coords[1],
             }
 
-        # Try width/height
-        width: float = 100.0
-        height: float = 50.0
-
-        width_match = re.search(r"width\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if width_match:
-            width = float(width_match.group(1))
-
-        height_match = re.search(r"height\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if height_match:
-            height = float(height_match.group(1))
-
-        # Chinese
-        width_cn = re.search(r"宽\s*[=:]?\s*(\d+\.?\d*)", text)
-        if width_cn:
-            width = float(width_cn.group(1))
-
-        height_cn = re.search(r"高\s*[=:]?\s*(\d+\.?\d*)", text)
-        if height_cn:
-            height = float(height_cn.group(1))
-
+        # Fall back to width/height keywords
         return {
             "corner1": (0, 0),
-            "corner2": (width, height),
+            "corner2": (kv.get("width", 100.0), kv.get("height", 50.0)),
         }
 
-    def _parse_polyline(self, text: str) -> dict[str, Any]:
+    def _parse_polyline(self, text: str, kv: dict[str, Any]) -> dict[str, Any]:
         """Parse polyline command parameters."""
         coords = self.extract_coordinates(text)
 
@@ -535,7 +642,7 @@ class NLPProcessor:
             "closed": closed,
         }
 
-    def _parse_text(self, text: str) -> dict[str, Any]:
+    def _parse_text(self, text: str, kv: dict[str, Any]) -> dict[str, Any]:
         """Parse text command parameters."""
         coords = self.extract_coordinates(text)
         content = self.extract_quoted_text(text) or "Text"
@@ -543,27 +650,13 @@ class NLPProcessor:
         params: dict[str, Any] = {
             "position": coords[0] if coords else (0, 0),
             "text": content,
-            "height": 2.5,
-            "rotation": 0,
+            "height": kv.get("height", 2.5),
+            "rotation": kv.get("rotation", 0),
         }
 
-        # Look for height
-        height_match = re.search(r"height\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if height_match:
-            params["height"] = float(height_match.group(1))
-
-        height_cn = re.search(r"高度\s*[=:]?\s*(\d+\.?\d*)", text)
-        if height_cn:
-            params["height"] = float(height_cn.group(1))
-
-        # Look for rotation
-        rotation_match = re.search(r"rotation\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if rotation_match:
-            params["rotation"] = float(rotation_match.group(1))
-
         return params
 
-    def _parse_dimension(self, text: str) -> dict[str, Any]:
+    def _parse_dimension(self, text: str, kv: dict[str, Any]) -> dict[str, Any]:
         """Parse dimension command parameters."""
         coords = self.extract_coordinates(text)
 
@@ -584,36 +677,26 @@ class NLPProcessor:
             "text_position": (50, 10),
         }
 
-    def _parse_hatch(self, text: str) -> dict[str, Any]:
+    def _parse_hatch(self, text: str, kv: dict[str, Any]) -> dict[str, Any]:
         """Parse hatch command parameters."""
         coords = self.extract_coordinates(text)
 
         params: dict[str, Any] = {
             "boundary_points": coords if len(coords) >= 3 else [(0, 0), (100, 0), (100, 100), (0, 100)],
-            "pattern_name": "SOLID",
-            "pattern_scale": 1.0,
+            "pattern_name": kv.get("pattern", "SOLID"),
+            "pattern_scale": kv.get("scale", 1.0),
         }
 
-        # Look for pattern name
-        pattern_match = re.search(r"pattern\s*[=:]?\s*(\w+)", text, re.IGNORECASE)
-        if pattern_match:
-            params["pattern_name"] = pattern_match.group(1).upper()
-
-        # Look for scale
-        scale_match = re.search(r"scale\s*[=:]?\s*(\d+\.?\d*)", text, re.IGNORECASE)
-        if scale_match:
-            params["pattern_scale"] = float(scale_match.group(1))
-
         return params
 
-    def _parse_save(self, text: str) -> dict[str, Any]:
+    def _parse_save(self, text: str, kv: dict[str, Any]) -> dict[str, Any]:
         """Parse save command parameters."""
         # Look for file path in quotes
         path = self.extract_quoted_text(text)
 
         # Or look for .dwg extension
         if not path:
-            dwg_match = re.search(r"(\S+\.dwg)", text, re.IGNORECASE)
+            dwg_match = _DWG_RE.search(text)
             if dwg_match:
                 path = dwg_match.group(1)
 
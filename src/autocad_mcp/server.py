@@ -7,12 +7,22 @@ Model Context Protocol server for controlling AutoCAD through Claude Desktop.
 from __future__ import annotations
 
 import asyncio
+import atexit
+import functools
+import importlib
 import json
 import logging
+import operator
+import queue
 import sys
+import time
+from collections.abc import Callable, Mapping, Sequence
+from contextlib import AbstractContextManager
 from dataclasses import dataclass, field
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -25,31 +35,205 @@ from mcp.types import (
     TextContent,
     Tool,
 )
+from pydantic import AnyUrl
 
 from autocad_mcp.cad_controller import CADController
-from autocad_mcp.config import load_config
+from autocad_mcp.config import Config, load_config
 from autocad_mcp.nlp_processor import NLPProcessor
 
-# Configure logging
+# Any, so the None fallback type-checks whether or not orjson is installed
+orjson: Any
+try:
+    import orjson
+except ImportError:  # optional, see the "orjson" extra
+    orjson = None
+
+# fastjsonschema ships no type information; loading it by name keeps mypy
+# from needing stubs or a config override that would go unused when only
+# the mypyc-compiled NLP module is checked
+fastjsonschema: Any
+try:
+    fastjsonschema = importlib.import_module("fastjsonschema")
+except ImportError:  # optional, see the "fastjsonschema" extra
+    fastjsonschema = None
+
+# Configure logging. Records are formatted by the QueueHandler and written
+# to stderr and the log file on a background thread, so tool calls never
+# block on log I/O.
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_log_listener = QueueListener(
+    _log_queue,
+    logging.StreamHandler(sys.stderr),
+    logging.FileHandler("autocad_mcp.log", encoding="utf-8"),
+)
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stderr),
-        logging.FileHandler("autocad_mcp.log", encoding="utf-8"),
-    ],
+    handlers=[QueueHandler(_log_queue)],
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Seconds a successful is_running() probe is trusted before pinging CAD again
+_LIVENESS_TTL = 5.0
+
+# Draws run immediately, but the viewport regen is coalesced: it happens once
+# a burst of draws has been idle this long, or after this many entities
+_FLUSH_DELAY = 0.2
+_FLUSH_THRESHOLD = 50
+
+# Compact size above which drawing://current is no longer indented; point-heavy
+# states grow several times over when pretty-printed
+_PRETTY_STATE_LIMIT = 64 * 1024
+
+# Largest cross product, relative to the boundary's squared extent, that still
+# counts hatch boundary points as collinear
+_COLLINEAR_TOLERANCE = 1e-9
+
+# Failure result templates; return copies so callers may safely modify results
+_NOT_INITIALIZED: dict[str, Any] = {"success": False, "error": "CAD not initialized"}
+_SHORT_CENTER: dict[str, Any] = {
+    "success": False,
+    "error": "Center must have at least 2 coordinates",
+}
+_NON_POSITIVE_RADIUS: dict[str, Any] = {"success": False, "error": "Radius must be positive"}
+
+
+def _to_json(data: Any, pretty: bool = False) -> str:
+    """
+    Serialize a tool result or state snapshot as JSON text.
+
+    Tool results are read by the client, not a person, so they are compact
+    by default; pass ``pretty`` for output meant to be inspected.
+    """
+    if orjson is not None:
+        # NON_STR_KEYS matches json's handling of int/float dict keys
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        text: str = orjson.dumps(data, option=option).decode()
+        return text
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _color_error(color: int | None) -> str | None:
+    """Return an error unless color is None or an integer index in 0-255."""
+    if color is None:
+        return None
+    # The JSON schema's "integer" also admits integral floats such as 5.0;
+    # name the type problem instead of reporting a misleading range error
+    if not isinstance(color, int):
+        return "Color must be an integer"
+    # One mask test covers both bounds: any bit above 0xFF (or a sign) fails
+    if color & ~0xFF:
+        return "Color must be between 0 and 255"
+    return None
+
+
+def _short_point_error(points: list[list[float]]) -> str | None:
+    """Return an error for the first point with fewer than 2 coordinates."""
+    # min(map(len, ...)) scans in C; only locate the offender on failure
+    if min(map(len, points)) >= 2:
+        return None
+    index = next(i for i, pt in enumerate(points) if len(pt) < 2)
+    return f"Point {index} must have at least 2 coordinates"
+
+
+def _is_collinear(points: Sequence[Sequence[float]]) -> bool:
+    """
+    Check whether all points lie on one line in XY.
+
+    True for fewer than 3 distinct points or when every cross product with
+    the longest offset from the first point is zero, relative to that
+    offset's length so the test holds at any drawing scale. Self-intersecting
+    loops whose lobes cancel out still pass.
+    """
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(points, np.ndarray):
+        offsets = points[:, :2] - points[0, :2]
+        lengths = np.einsum("ij,ij->i", offsets, offsets)
+        far = int(lengths.argmax())
+        ux, uy = offsets[far]
+        cross = offsets[:, 0] * uy - offsets[:, 1] * ux
+        return bool(np.abs(cross).max() <= _COLLINEAR_TOLERANCE * lengths[far])
+
+    x0, y0 = points[0][0], points[0][1]
+    offsets = [(pt[0] - x0, pt[1] - y0) for pt in points]
+    lengths = [dx * dx + dy * dy for dx, dy in offsets]
+    far = max(range(len(lengths)), key=lengths.__getitem__)
+    ux, uy = offsets[far]
+    limit = _COLLINEAR_TOLERANCE * lengths[far]
+    return all(abs(dx * uy - dy * ux) <= limit for dx, dy in offsets)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_config() -> Config:
+    """Load the server configuration once per process."""
+    return load_config()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_nlp() -> NLPProcessor:
+    """Create the NLP processor once per process; it holds no session state."""
+    return NLPProcessor()
+
+
+# A service method bound for a tool, a getter returning its positional
+# arguments from a mapping, and the defaults for its optional arguments
+ToolMethod = tuple[
+    Callable[..., dict[str, Any]],
+    Callable[[Mapping[str, Any]], tuple[Any, ...]],
+    dict[str, Any],
+]
+
 
-@dataclass
+@dataclass(slots=True)
 class DrawingState:
-    """Current state of the CAD drawing."""
+    """
+    Current state of the CAD drawing.
+
+    Entities are stored column-wise: one list of key tuples and one of value
+    tuples. Entities of the same kind share a single key tuple, so each one
+    costs a tuple instead of a dict until the state is read.
+    """
 
-    entities: list[dict[str, Any]] = field(default_factory=list)
     current_layer: str = "0"
-    last_command: str = ""
     last_result: str = ""
+    # Either a finished string or a (template, args) pair formatted on read
+    _last_command: str | tuple[str, tuple[Any, ...]] = field(default="", repr=False)
+    _entity_keys: list[tuple[str, ...]] = field(default_factory=list, repr=False)
+    _entity_values: list[tuple[Any, ...]] = field(default_factory=list, repr=False)
+    _key_tuples: dict[tuple[str, ...], tuple[str, ...]] = field(
+        default_factory=dict, repr=False
+    )
+
+    @property
+    def last_command(self) -> str:
+        """Description of the last successful command."""
+        command = self._last_command
+        if isinstance(command, tuple):
+            template, args = command
+            command = self._last_command = template.format(*args)
+        return command
+
+    @last_command.setter
+    def last_command(self, command: str) -> None:
+        self._last_command = command
+
+    def record_command(self, template: str, args: tuple[Any, ...]) -> None:
+        """Record the last command without formatting it until it is read."""
+        self._last_command = (template, args)
+
+    @property
+    def entities(self) -> list[dict[str, Any]]:
+        """Entities added so far, materialized as dicts."""
+        return [
+            dict(zip(k, v, strict=True))
+            for k, v in zip(self._entity_keys, self._entity_values, strict=True)
+        ]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -58,38 +242,169 @@ class DrawingState:
             "current_layer": self.current_layer,
             "last_command": self.last_command,
             "last_result": self.last_result,
-            "entity_count": len(self.entities),
+            "entity_count": len(self._entity_values),
         }
 
     def add_entity(self, entity: dict[str, Any]) -> None:
         """Add an entity to the drawing state."""
-        self.entities.append(entity)
+        keys = tuple(entity)
+        self._entity_keys.append(self._key_tuples.setdefault(keys, keys))
+        self._entity_values.append(tuple(entity.values()))
 
 
 class CADService:
     """High-level service for CAD operations."""
 
+    __slots__ = (
+        "config",
+        "controller",
+        "nlp",
+        "state",
+        "tool_methods",
+        "_alive_until",
+        "_open_batch",
+        "_pending_draws",
+        "_flush_handle",
+        "_flush_suspended",
+        "_state_json",
+    )
+
     def __init__(self) -> None:
         """Initialize CAD service."""
-        self.config = load_config()
+        self.config = _shared_config()
         self.controller = CADController(self.config.cad)
-        self.nlp = NLPProcessor()
+        self.nlp = _shared_nlp()
         self.state = DrawingState()
-        self._initialized = False
+        # Monotonic deadline until which CAD is assumed alive without a probe;
+        # -inf until CAD has started
+        self._alive_until = float("-inf")
+        self._open_batch: AbstractContextManager[CADController] | None = None
+        self._pending_draws = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Set while draw_many runs, so its whole set shares one regeneration
+        self._flush_suspended = False
+        # Serialized state for drawing://current, dropped whenever state changes
+        self._state_json: str | None = None
+        # Tool name -> (bound method, argument getter, defaults), built once
+        self.tool_methods: dict[str, ToolMethod] = {
+            tool: (
+                getattr(self, method),
+                _arg_getter(required + tuple(key for key, _ in optional)),
+                dict(optional),
+            )
+            for tool, (method, required, optional) in _TOOL_ARGS.items()
+        }
+
+    def state_json(self) -> str:
+        """
+        Drawing state as JSON, re-serialized only after it changes.
+
+        Small states are indented for reading; past _PRETTY_STATE_LIMIT the
+        compact form is kept, since indentation would multiply the bytes sent
+        over the stdio pipe.
+        """
+        if self._state_json is None:
+            data = self.state.to_dict()
+            text = _to_json(data)
+            if len(text) <= _PRETTY_STATE_LIMIT:
+                text = _to_json(data, pretty=True)
+            self._state_json = text
+        return self._state_json
 
     def ensure_initialized(self) -> bool:
         """Ensure CAD is initialized."""
-        if self._initialized and self.controller.is_running():
+        # Hot path: one comparison; the deadline stays -inf until started
+        now = time.monotonic()
+        if now < self._alive_until:
+            return True
+
+        # An expired but finite deadline means CAD was started: probe it
+        if self._alive_until > float("-inf") and self.controller.is_running():
+            self._alive_until = now + _LIVENESS_TTL
             return True
 
         logger.info("Initializing CAD connection...")
         if self.controller.start():
-            self._initialized = True
+            self._alive_until = time.monotonic() + _LIVENESS_TTL
             return True
 
         logger.error("Failed to initialize CAD")
+        self._alive_until = float("-inf")
         return False
 
+    def _draw(
+        self,
+        draw: Callable[..., dict[str, Any]],
+        args: tuple[Any, ...],
+        color: int | None,
+        command: str,
+        command_args: tuple[Any, ...] = (),
+    ) -> dict[str, Any]:
+        """
+        Run the steps shared by every draw method around a controller call.
+
+        Args:
+            draw: Controller method that creates the entity.
+            args: Positional arguments for the controller method.
+            color: Requested color index, validated before CAD is touched.
+            command: ``str.format`` template recorded as the last command on success.
+            command_args: Values for the template, formatted only when read.
+
+        Returns:
+            Controller result, or an error dict if validation or startup fails.
+        """
+        color_error = _color_error(color)
+        if color_error:
+            return {"success": False, "error": color_error}
+
+        if not self.ensure_initialized():
+            return dict(_NOT_INITIALIZED)
+
+        if self._open_batch is None:
+            self._open_batch = self.controller.batch()
+            self._open_batch.__enter__()
+
+        result = draw(*args)
+        if result["success"]:
+            self.state.add_entity(result)
+            self.state.record_command(command, command_args)
+            self.state.last_result = "success"
+            self._state_json = None
+            self._pending_draws += 1
+        self._schedule_flush()
+        return result
+
+    def _schedule_flush(self) -> None:
+        """Flush now, or (re)arm the idle timer when running inside the server loop."""
+        if self._flush_suspended:
+            return
+
+        if self._pending_draws >= _FLUSH_THRESHOLD:
+            self.flush()
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called outside an event loop: nothing would fire the timer
+            self.flush()
+            return
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = loop.call_later(_FLUSH_DELAY, self.flush)
+
+    def flush(self) -> None:
+        """Close the open draw batch, regenerating the view once for all its draws."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._open_batch = self._open_batch, None
+        self._pending_draws = 0
+        if batch is not None:
+            batch.__exit__(None, None, None)
+
     def draw_line(
         self,
         start: list[float],
@@ -102,20 +417,13 @@ class CADService:
         if len(start) < 2 or len(end) < 2:
             return {"success": False, "error": "Coordinates must have at least 2 values"}
         
-        if not self.ensure_initialized():
-            return {"success": False, "error": "CAD not initialized"}
-
-        if color is not None and (color < 0 or color > 255):
-            return {"success": False, "error": "Color must be between 0 and 255"}
-
-        result = self.controller.draw_line(
-            tuple(start), tuple(end), layer, color, lineweight
+        return self._draw(
+            self.controller.draw_line,
+            (start, end, layer, color, lineweight),
+            color,
+            "draw_line({}, {})",
+            (start, end),
         )
-        if result["success"]:
-            self.state.add_entity(result)
-            self.state.last_command = f"draw_line({start}, {end})"
-            self.state.last_result = "success"
-        return result
 
     def draw_circle(
         self,
@@ -127,25 +435,18 @@ class CADService:
     ) -> dict[str, Any]:
         """Draw a circle."""
         if len(center) < 2:
-            return {"success": False, "error": "Center must have at least 2 coordinates"}
+            return dict(_SHORT_CENTER)
         
         if radius <= 0:
-            return {"success": False, "error": "Radius must be positive"}
+            return dict(_NON_POSITIVE_RADIUS)
         
-        if not self.ensure_initialized():
-            return {"success": False, "error": "CAD not initialized"}
-
-        if color is not None and (color < 0 or color > 255):
-            return {"success": False, "error": "Color must be between 0 and 255"}
-
-        result = self.controller.draw_circle(
-            tuple(center), radius, layer, color, lineweight
+        return self._draw(
+            self.controller.draw_circle,
+            (center, radius, layer, color, lineweight),
+            color,
+            "draw_circle({}, {})",
+            (center, radius),
         )
-        if result["success"]:
-            self.state.add_entity(result)
-            self.state.last_command = f"draw_circle({center}, {radius})"
-            self.state.last_result = "success"
-        return result
 
     def draw_arc(
         self,
@@ -159,25 +460,18 @@ class CADService:
     ) -> dict[str, Any]:
         """Draw an arc."""
         if len(center) < 2:
-            return {"success": False, "error": "Center must have at least 2 coordinates"}
+            return dict(_SHORT_CENTER)
         
         if radius <= 0:
-            return {"success": False, "error": "Radius must be positive"}
+            return dict(_NON_POSITIVE_RADIUS)
         
-        if not self.ensure_initialized():
-            return {"success": False, "error": "CAD not initialized"}
-
-        if color is not None and (color < 0 or color > 255):
-            return {"success": False, "error": "Color must be between 0 and 255"}
-
-        result = self.controller.draw_arc(
-            tuple(center), radius, start_angle, end_angle, layer, color, lineweight
+        return self._draw(
+            self.controller.draw_arc,
+            (center, radius, start_angle, end_angle, layer, color, lineweight),
+            color,
+            "draw_arc({}, {}, {}, {})",
+            (center, radius, start_angle, end_angle),
         )
-        if result["success"]:
-            self.state.add_entity(result)
-            self.state.last_command = f"draw_arc({center}, {radius}, {start_angle}, {end_angle})"
-            self.state.last_result = "success"
-        return result
 
     def draw_ellipse(
         self,
@@ -191,7 +485,7 @@ class CADService:
     ) -> dict[str, Any]:
         """Draw an ellipse."""
         if len(center) < 2:
-            return {"success": False, "error": "Center must have at least 2 coordinates"}
+            return dict(_SHORT_CENTER)
         
         if major_axis <= 0:
             return {"success": False, "error": "Major axis must be positive"}
@@ -199,20 +493,13 @@ class CADService:
         if minor_axis < 0:
             return {"success": False, "error": "Minor axis must be non-negative"}
         
-        if not self.ensure_initialized():
-            return {"success": False, "error": "CAD not initialized"}
-
-        if color is not None and (color < 0 or color > 255):
-            return {"success": False, "error": "Color must be between 0 and 255"}
-
-        result = self.controller.draw_ellipse(
-            tuple(center), major_axis, minor_axis, rotation, layer, color, lineweight
+        return self._draw(
+            self.controller.draw_ellipse,
+            (center, major_axis, minor_axis, rotation, layer, color, lineweight),
+            color,
+            "draw_ellipse({}, {}, {})",
+            (center, major_axis, minor_axis),
         )
-        if result["success"]:
-            self.state.add_entity(result)
-            self.state.last_command = f"draw_ellipse({center}, {major_axis}, {minor_axis})"
-            self.state.last_result = "success"
-        return result
 
     def draw_polyline(
         self,
@@ -226,25 +513,17 @@ class CADService:
         if len(points) < 2:
             return {"success": False, "error": "Polyline requires at least 2 points"}
         
-        for i, pt in enumerate(points):
-            if len(pt) < 2:
-                return {"success": False, "error": f"Point {i} must have at least 2 coordinates"}
+        point_error = _short_point_error(points)
+        if point_error:
+            return {"success": False, "error": point_error}
         
-        if not self.ensure_initialized():
-            return {"success": False, "error": "CAD not initialized"}
-
-        if color is not None and (color < 0 or color > 255):
-            return {"success": False, "error": "Color must be between 0 and 255"}
-
-        tuple_points = [tuple(p) for p in points]
-        result = self.controller.draw_polyline(
-            tuple_points, closed, layer, color, lineweight
+        return self._draw(
+            self.controller.draw_polyline,
+            (points, closed, layer, color, lineweight),
+            color,
+            "draw_polyline({} points, closed={})",
+            (len(points), closed),
         )
-        if result["success"]:
-            self.state.add_entity(result)
-            self.state.last_command = f"draw_polyline({len(points)} points, closed={closed})"
-            self.state.last_result = "success"
-        return result
 
     def draw_rectangle(
         self,
@@ -258,20 +537,13 @@ class CADService:
         if len(corner1) < 2 or len(corner2) < 2:
             return {"success": False, "error": "Corners must have at least 2 coordinates"}
         
-        if not self.ensure_initialized():
-            return {"success": False, "error": "CAD not initialized"}
-
-        if color is not None and (color < 0 or color > 255):
-            return {"success": False, "error": "Color must be between 0 and 255"}
-
-        result = self.controller.draw_rectangle(
-            tuple(corner1), tuple(corner2), layer, color, lineweight
+        return self._draw(
+            self.controller.draw_rectangle,
+            (corner1, corner2, layer, color, lineweight),
+            color,
+            "draw_rectangle({}, {})",
+            (corner1, corner2),
         )
-        if result["success"]:
-            self.state.add_entity(result)
-            self.state.last_command = f"draw_rectangle({corner1}, {corner2})"
-            self.state.last_result = "success"
-        return result
 
     def draw_text(
         self,
@@ -292,20 +564,13 @@ class CADService:
         if height <= 0:
             return {"success": False, "error": "Height must be positive"}
         
-        if not self.ensure_initialized():
-            return {"success": False, "error": "CAD not initialized"}
-
-        if color is not None and (color < 0 or color > 255):
-            return {"success": False, "error": "Color must be between 0 and 255"}
-
-        result = self.controller.draw_text(
-            tuple(position), text, height, rotation, layer, color
+        return self._draw(
+            self.controller.draw_text,
+            (position, text, height, rotation, layer, color),
+            color,
+            "draw_text('{}')",
+            (text,),
         )
-        if result["success"]:
-            self.state.add_entity(result)
-            self.state.last_command = f"draw_text('{text}')"
-            self.state.last_result = "success"
-        return result
 
     def draw_hatch(
         self,
@@ -319,9 +584,13 @@ class CADService:
         if len(boundary_points) < 3:
             return {"success": False, "error": "Hatch requires at least 3 boundary points"}
         
-        for i, pt in enumerate(boundary_points):
-            if len(pt) < 2:
-                return {"success": False, "error": f"Point {i} must have at least 2 coordinates"}
+        point_error = _short_point_error(boundary_points)
+        if point_error:
+            return {"success": False, "error": point_error}
+
+        # Collinear or repeated points would only fail later in hatch Evaluate()
+        if _is_collinear(boundary_points):
+            return {"success": False, "error": "Hatch boundary points must not all lie on one line"}
         
         if not pattern_name:
             return {"success": False, "error": "Pattern name cannot be empty"}
@@ -329,21 +598,13 @@ class CADService:
         if pattern_scale <= 0:
             return {"success": False, "error": "Pattern scale must be positive"}
         
-        if not self.ensure_initialized():
-            return {"success": False, "error": "CAD not initialized"}
-
-        if color is not None and (color < 0 or color > 255):
-            return {"success": False, "error": "Color must be between 0 and 255"}
-
-        tuple_points = [tuple(p) for p in boundary_points]
-        result = self.controller.draw_hatch(
-            tuple_points, pattern_name, pattern_scale, layer, color
+        return self._draw(
+            self.controller.draw_hatch,
+            (boundary_points, pattern_name, pattern_scale, layer, color),
+            color,
+            "draw_hatch(pattern={})",
+            (pattern_name,),
         )
-        if result["success"]:
-            self.state.add_entity(result)
-            self.state.last_command = f"draw_hatch(pattern={pattern_name})"
-            self.state.last_result = "success"
-        return result
 
     def add_dimension(
         self,
@@ -357,20 +618,62 @@ class CADService:
         if len(start) < 2 or len(end) < 2 or len(text_position) < 2:
             return {"success": False, "error": "All points must have at least 2 coordinates"}
         
-        if not self.ensure_initialized():
-            return {"success": False, "error": "CAD not initialized"}
-
-        if color is not None and (color < 0 or color > 255):
-            return {"success": False, "error": "Color must be between 0 and 255"}
-
-        result = self.controller.add_dimension(
-            tuple(start), tuple(end), tuple(text_position), layer, color
+        return self._draw(
+            self.controller.add_dimension,
+            (start, end, text_position, layer, color),
+            color,
+            "add_dimension({}, {})",
+            (start, end),
         )
-        if result["success"]:
-            self.state.add_entity(result)
-            self.state.last_command = f"add_dimension({start}, {end})"
-            self.state.last_result = "success"
-        return result
+
+    def draw_many(self, entities: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
+        """
+        Draw several entities in one call.
+
+        Each entity names its kind in ``type`` and carries the arguments of the
+        matching draw tool. The draws share one open batch, so the viewport
+        regenerates once for the whole set rather than per entity.
+
+        Args:
+            entities: Entity specs, e.g. ``{"type": "line", "start": [0, 0], "end": [9, 9]}``.
+
+        Returns:
+            Result dictionary with the number of entities drawn and the index
+            and error of each entity that failed.
+        """
+        drawn = 0
+        errors: list[dict[str, Any]] = []
+        # Hold regeneration until the whole set is drawn, however large it is
+        self._flush_suspended = True
+        try:
+            for index, entity in enumerate(entities):
+                kind = entity.get("type")
+                tool = _ENTITY_TOOLS.get(kind) if isinstance(kind, str) else None
+                if tool is None:
+                    errors.append({"index": index, "error": f"Unknown entity type: {kind}"})
+                    continue
+
+                error = _entity_argument_error(tool, entity)
+                if error is None:
+                    method, get_args, defaults = self.tool_methods[tool]
+                    try:
+                        result = method(*get_args({**defaults, **entity}))
+                    except Exception as e:
+                        logger.exception("Error drawing entity %d of draw_many", index)
+                        result = {"success": False, "error": str(e)}
+                    if result["success"]:
+                        drawn += 1
+                        continue
+                    error = result["error"]
+                else:
+                    # Bad input from the client, not a server fault: no traceback
+                    logger.warning("Skipping entity %d of draw_many: %s", index, error)
+                errors.append({"index": index, "error": error})
+        finally:
+            self._flush_suspended = False
+            self._schedule_flush()
+
+        return {"success": not errors, "type": "batch", "count": drawn, "errors": errors}
 
     def save_drawing(self, file_path: str) -> dict[str, Any]:
         """Save the drawing."""
@@ -381,18 +684,21 @@ class CADService:
             return {"success": False, "error": "File path cannot be whitespace"}
         
         if not self.ensure_initialized():
-            return {"success": False, "error": "CAD not initialized"}
+            return dict(_NOT_INITIALIZED)
 
+        self.flush()
         result = self.controller.save_drawing(file_path)
         if result["success"]:
             self.state.last_command = f"save_drawing('{file_path}')"
             self.state.last_result = "success"
+            self._state_json = None
         return result
 
     def process_natural_language(self, command: str) -> dict[str, Any]:
         """Process a natural language command."""
         parsed = self.nlp.parse_command(command)
         self.state.last_command = command
+        self._state_json = None
 
         if not parsed.shape:
             return {
@@ -404,43 +710,30 @@ class CADService:
                 },
             }
 
-        # Map shape to service method
-        method_map = {
-            "line": self._execute_line,
-            "circle": self._execute_circle,
-            "arc": self._execute_arc,
-            "ellipse": self._execute_ellipse,
-            "rectangle": self._execute_rectangle,
-            "polyline": self._execute_polyline,
-            "text": self._execute_text,
-            "hatch": self._execute_hatch,
-            "dimension": self._execute_dimension,
-        }
-
-        handler = method_map.get(parsed.shape)
+        handler = self._SHAPE_HANDLERS.get(parsed.shape)
         if handler:
-            return handler(parsed.parameters)
+            return handler(self, parsed.parameters)
 
         return {
             "success": False,
             "error": f"Unsupported shape: {parsed.shape}",
         }
 
-    def _execute_line(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _execute_line(self, params: Mapping[str, Any]) -> dict[str, Any]:
         return self.draw_line(
             list(params.get("start", [0, 0])),
             list(params.get("end", [100, 100])),
             color=params.get("color"),
         )
 
-    def _execute_circle(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _execute_circle(self, params: Mapping[str, Any]) -> dict[str, Any]:
         return self.draw_circle(
             list(params.get("center", [0, 0])),
             params.get("radius", 50),
             color=params.get("color"),
         )
 
-    def _execute_arc(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _execute_arc(self, params: Mapping[str, Any]) -> dict[str, Any]:
         return self.draw_arc(
             list(params.get("center", [0, 0])),
             params.get("radius", 50),
@@ -449,7 +742,7 @@ class CADService:
             color=params.get("color"),
         )
 
-    def _execute_ellipse(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _execute_ellipse(self, params: Mapping[str, Any]) -> dict[str, Any]:
         return self.draw_ellipse(
             list(params.get("center", [0, 0])),
             params.get("major_axis", 100),
@@ -458,14 +751,14 @@ class CADService:
             color=params.get("color"),
         )
 
-    def _execute_rectangle(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _execute_rectangle(self, params: Mapping[str, Any]) -> dict[str, Any]:
         return self.draw_rectangle(
             list(params.get("corner1", [0, 0])),
             list(params.get("corner2", [100, 100])),
             color=params.get("color"),
         )
 
-    def _execute_polyline(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _execute_polyline(self, params: Mapping[str, Any]) -> dict[str, Any]:
         points = params.get("points", [[0, 0], [50, 50], [100, 0]])
         return self.draw_polyline(
             [list(p) for p in points],
@@ -473,7 +766,7 @@ class CADService:
             color=params.get("color"),
         )
 
-    def _execute_text(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _execute_text(self, params: Mapping[str, Any]) -> dict[str, Any]:
         return self.draw_text(
             list(params.get("position", [0, 0])),
             params.get("text", "Text"),
@@ -482,7 +775,7 @@ class CADService:
             color=params.get("color"),
         )
 
-    def _execute_hatch(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _execute_hatch(self, params: Mapping[str, Any]) -> dict[str, Any]:
         points = params.get("boundary_points", [[0, 0], [100, 0], [100, 100], [0, 100]])
         return self.draw_hatch(
             [list(p) for p in points],
@@ -491,7 +784,7 @@ class CADService:
             color=params.get("color"),
         )
 
-    def _execute_dimension(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _execute_dimension(self, params: Mapping[str, Any]) -> dict[str, Any]:
         return self.add_dimension(
             list(params.get("start", [0, 0])),
             list(params.get("end", [100, 0])),
@@ -499,43 +792,78 @@ class CADService:
             color=params.get("color"),
         )
 
+    # Natural-language shape name -> executor, built once per class
+    _SHAPE_HANDLERS: ClassVar[
+        Mapping[str, Callable[[CADService, Mapping[str, Any]], dict[str, Any]]]
+    ] = MappingProxyType(
+        {
+            "line": _execute_line,
+            "circle": _execute_circle,
+            "arc": _execute_arc,
+            "ellipse": _execute_ellipse,
+            "rectangle": _execute_rectangle,
+            "polyline": _execute_polyline,
+            "text": _execute_text,
+            "hatch": _execute_hatch,
+            "dimension": _execute_dimension,
+        }
+    )
+
 
-# Tool definitions
-TOOLS: list[Tool] = [
+# Sub-schemas shared by reference across the tool definitions below
+_POINT_ITEMS: dict[str, Any] = {
+    "type": "array",
+    "items": {"type": "number"},
+    "minItems": 2,
+    "maxItems": 3,
+}
+_LAYER_SCHEMA: dict[str, Any] = {"type": "string", "description": "Layer name (optional)"}
+_COLOR_SCHEMA: dict[str, Any] = {
+    "type": "integer",
+    "minimum": 0,
+    "maximum": 255,
+    "description": "Color index 0-255 (optional)",
+}
+_LINEWEIGHT_SCHEMA: dict[str, Any] = {
+    "type": "integer",
+    "description": "Line weight in hundredths of mm (optional)",
+}
+
+
+def _point_schema(description: str) -> dict[str, Any]:
+    """Schema for a single [x, y] or [x, y, z] point."""
+    return {**_POINT_ITEMS, "description": description}
+
+
+# draw_many entity type -> the draw tool whose arguments it takes
+_ENTITY_TOOLS: dict[str, str] = {
+    "line": "draw_line",
+    "circle": "draw_circle",
+    "arc": "draw_arc",
+    "ellipse": "draw_ellipse",
+    "polyline": "draw_polyline",
+    "rectangle": "draw_rectangle",
+    "text": "draw_text",
+    "hatch": "draw_hatch",
+    "dimension": "add_dimension",
+}
+
+
+# Tool definitions. Clients send these to the model ahead of every turn and
+# cache them as a prompt prefix, so keep them static and in a fixed order:
+# no per-session or per-request content here.
+TOOLS: tuple[Tool, ...] = (
     Tool(
         name="draw_line",
         description="Draw a straight line between two points in AutoCAD",
         inputSchema={
             "type": "object",
             "properties": {
-                "start": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                    "minItems": 2,
-                    "maxItems": 3,
-                    "description": "Start point coordinates [x, y] or [x, y, z]",
-                },
-                "end": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                    "minItems": 2,
-                    "maxItems": 3,
-                    "description": "End point coordinates [x, y] or [x, y, z]",
-                },
-                "layer": {
-                    "type": "string",
-                    "description": "Layer name (optional)",
-                },
-                "color": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "maximum": 255,
-                    "description": "Color index 0-255 (optional)",
-                },
-                "lineweight": {
-                    "type": "integer",
-                    "description": "Line weight in hundredths of mm (optional)",
-                },
+                "start": _point_schema("Start point coordinates [x, y] or [x, y, z]"),
+                "end": _point_schema("End point coordinates [x, y] or [x, y, z]"),
+                "layer": _LAYER_SCHEMA,
+                "color": _COLOR_SCHEMA,
+                "lineweight": _LINEWEIGHT_SCHEMA,
             },
             "required": ["start", "end"],
         },
@@ -546,29 +874,15 @@ TOOLS: list[Tool] = [
         inputSchema={
             "type": "object",
             "properties": {
-                "center": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                    "minItems": 2,
-                    "maxItems": 3,
-                    "description": "Center point coordinates [x, y] or [x, y, z]",
-                },
+                "center": _point_schema("Center point coordinates [x, y] or [x, y, z]"),
                 "radius": {
                     "type": "number",
                     "minimum": 0,
                     "description": "Circle radius",
                 },
-                "layer": {"type": "string", "description": "Layer name (optional)"},
-                "color": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "maximum": 255,
-                    "description": "Color index 0-255 (optional)",
-                },
-                "lineweight": {
-                    "type": "integer",
-                    "description": "Line weight in hundredths of mm (optional)",
-                },
+                "layer": _LAYER_SCHEMA,
+                "color": _COLOR_SCHEMA,
+                "lineweight": _LINEWEIGHT_SCHEMA,
             },
             "required": ["center", "radius"],
         },
@@ -579,13 +893,7 @@ TOOLS: list[Tool] = [
         inputSchema={
             "type": "object",
             "properties": {
-                "center": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                    "minItems": 2,
-                    "maxItems": 3,
-                    "description": "Center point coordinates [x, y] or [x, y, z]",
-                },
+                "center": _point_schema("Center point coordinates [x, y] or [x, y, z]"),
                 "radius": {"type": "number", "minimum": 0, "description": "Arc radius"},
                 "start_angle": {
                     "type": "number",
@@ -595,17 +903,9 @@ TOOLS: list[Tool] = [
                     "type": "number",
                     "description": "End angle in degrees",
                 },
-                "layer": {"type": "string", "description": "Layer name (optional)"},
-                "color": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "maximum": 255,
-                    "description": "Color index 0-255 (optional)",
-                },
-                "lineweight": {
-                    "type": "integer",
-                    "description": "Line weight in hundredths of mm (optional)",
-                },
+                "layer": _LAYER_SCHEMA,
+                "color": _COLOR_SCHEMA,
+                "lineweight": _LINEWEIGHT_SCHEMA,
             },
             "required": ["center", "radius", "start_angle", "end_angle"],
         },
@@ -616,13 +916,7 @@ TOOLS: list[Tool] = [
         inputSchema={
             "type": "object",
             "properties": {
-                "center": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                    "minItems": 2,
-                    "maxItems": 3,
-                    "description": "Center point coordinates [x, y] or [x, y, z]",
-                },
+                "center": _point_schema("Center point coordinates [x, y] or [x, y, z]"),
                 "major_axis": {
                     "type": "number",
                     "minimum": 0,
@@ -638,17 +932,9 @@ TOOLS: list[Tool] = [
                     "default": 0,
                     "description": "Rotation angle in degrees (optional)",
                 },
-                "layer": {"type": "string", "description": "Layer name (optional)"},
-                "color": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "maximum": 255,
-                    "description": "Color index 0-255 (optional)",
-                },
-                "lineweight": {
-                    "type": "integer",
-                    "description": "Line weight in hundredths of mm (optional)",
-                },
+                "layer": _LAYER_SCHEMA,
+                "color": _COLOR_SCHEMA,
+                "lineweight": _LINEWEIGHT_SCHEMA,
             },
             "required": ["center", "major_axis", "minor_axis"],
         },
@@ -661,12 +947,7 @@ TOOLS: list[Tool] = [
             "properties": {
                 "points": {
                     "type": "array",
-                    "items": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "minItems": 2,
-                        "maxItems": 3,
-                    },
+                    "items": _POINT_ITEMS,
                     "minItems": 2,
                     "description": "Array of points [[x1,y1], [x2,y2], ...]",
                 },
@@ -675,17 +956,9 @@ TOOLS: list[Tool] = [
                     "default": False,
                     "description": "Whether to close the polyline",
                 },
-                "layer": {"type": "string", "description": "Layer name (optional)"},
-                "color": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "maximum": 255,
-                    "description": "Color index 0-255 (optional)",
-                },
-                "lineweight": {
-                    "type": "integer",
-                    "description": "Line weight in hundredths of mm (optional)",
-                },
+                "layer": _LAYER_SCHEMA,
+                "color": _COLOR_SCHEMA,
+                "lineweight": _LINEWEIGHT_SCHEMA,
             },
             "required": ["points"],
         },
@@ -696,31 +969,11 @@ TOOLS: list[Tool] = [
         inputSchema={
             "type": "object",
             "properties": {
-                "corner1": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                    "minItems": 2,
-                    "maxItems": 3,
-                    "description": "First corner coordinates [x, y] or [x, y, z]",
-                },
-                "corner2": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                    "minItems": 2,
-                    "maxItems": 3,
-                    "description": "Opposite corner coordinates [x, y] or [x, y, z]",
-                },
-                "layer": {"type": "string", "description": "Layer name (optional)"},
-                "color": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "maximum": 255,
-                    "description": "Color index 0-255 (optional)",
-                },
-                "lineweight": {
-                    "type": "integer",
-                    "description": "Line weight in hundredths of mm (optional)",
-                },
+                "corner1": _point_schema("First corner coordinates [x, y] or [x, y, z]"),
+                "corner2": _point_schema("Opposite corner coordinates [x, y] or [x, y, z]"),
+                "layer": _LAYER_SCHEMA,
+                "color": _COLOR_SCHEMA,
+                "lineweight": _LINEWEIGHT_SCHEMA,
             },
             "required": ["corner1", "corner2"],
         },
@@ -731,13 +984,7 @@ TOOLS: list[Tool] = [
         inputSchema={
             "type": "object",
             "properties": {
-                "position": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                    "minItems": 2,
-                    "maxItems": 3,
-                    "description": "Text insertion point [x, y] or [x, y, z]",
-                },
+                "position": _point_schema("Text insertion point [x, y] or [x, y, z]"),
                 "text": {"type": "string", "description": "Text content"},
                 "height": {
                     "type": "number",
@@ -750,13 +997,8 @@ TOOLS: list[Tool] = [
                     "default": 0,
                     "description": "Rotation angle in degrees (optional)",
                 },
-                "layer": {"type": "string", "description": "Layer name (optional)"},
-                "color": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "maximum": 255,
-                    "description": "Color index 0-255 (optional)",
-                },
+                "layer": _LAYER_SCHEMA,
+                "color": _COLOR_SCHEMA,
             },
             "required": ["position", "text"],
         },
@@ -769,12 +1011,7 @@ TOOLS: list[Tool] = [
             "properties": {
                 "boundary_points": {
                     "type": "array",
-                    "items": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "minItems": 2,
-                        "maxItems": 3,
-                    },
+                    "items": _POINT_ITEMS,
                     "minItems": 3,
                     "description": "Boundary points forming a closed area",
                 },
@@ -789,13 +1026,8 @@ TOOLS: list[Tool] = [
                     "minimum": 0,
                     "description": "Pattern scale factor",
                 },
-                "layer": {"type": "string", "description": "Layer name (optional)"},
-                "color": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "maximum": 255,
-                    "description": "Color index 0-255 (optional)",
-                },
+                "layer": _LAYER_SCHEMA,
+                "color": _COLOR_SCHEMA,
             },
             "required": ["boundary_points"],
         },
@@ -806,36 +1038,42 @@ TOOLS: list[Tool] = [
         inputSchema={
             "type": "object",
             "properties": {
-                "start": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                    "minItems": 2,
-                    "maxItems": 3,
-                    "description": "Start point of dimension [x, y] or [x, y, z]",
-                },
-                "end": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                    "minItems": 2,
-                    "maxItems": 3,
-                    "description": "End point of dimension [x, y] or [x, y, z]",
-                },
-                "text_position": {
+                "start": _point_schema("Start point of dimension [x, y] or [x, y, z]"),
+                "end": _point_schema("End point of dimension [x, y] or [x, y, z]"),
+                "text_position": _point_schema("Position for dimension text [x, y] or [x, y, z]"),
+                "layer": _LAYER_SCHEMA,
+                "color": _COLOR_SCHEMA,
+            },
+            "required": ["start", "end", "text_position"],
+        },
+    ),
+    Tool(
+        name="draw_many",
+        description=(
+            "Draw several entities in one call. Each entity has a 'type' and the "
+            "same arguments as the matching draw tool"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entities": {
                     "type": "array",
-                    "items": {"type": "number"},
-                    "minItems": 2,
-                    "maxItems": 3,
-                    "description": "Position for dimension text [x, y] or [x, y, z]",
-                },
-                "layer": {"type": "string", "description": "Layer name (optional)"},
-                "color": {
-                    "type": "integer",
-                    "minimum": 0,
-                    "maximum": 255,
-                    "description": "Color index 0-255 (optional)",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "type": {
+                                "type": "string",
+                                "enum": list(_ENTITY_TOOLS),
+                                "description": "Entity kind, e.g. 'line' for draw_line arguments",
+                            },
+                        },
+                        "required": ["type"],
+                    },
+                    "minItems": 1,
+                    "description": "Entities to draw, in order",
                 },
             },
-            "required": ["start", "end", "text_position"],
+            "required": ["entities"],
         },
     ),
     Tool(
@@ -866,183 +1104,40 @@ TOOLS: list[Tool] = [
             "required": ["command"],
         },
     ),
-]
-
-
-# Global service instance
-cad_service: CADService | None = None
+)
 
 
+@functools.lru_cache(maxsize=1)
 def get_cad_service() -> CADService:
     """Get or create the CAD service instance."""
-    global cad_service
-    if cad_service is None:
-        cad_service = CADService()
-    return cad_service
-
+    return CADService()
 
-async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
-    """Handle a tool call and return the result as JSON string."""
-    service = get_cad_service()
 
-    try:
-        if name == "draw_line":
-            result = service.draw_line(
-                arguments["start"],
-                arguments["end"],
-                arguments.get("layer"),
-                arguments.get("color"),
-                arguments.get("lineweight"),
-            )
-        elif name == "draw_circle":
-            result = service.draw_circle(
-                arguments["center"],
-                arguments["radius"],
-                arguments.get("layer"),
-                arguments.get("color"),
-                arguments.get("lineweight"),
-            )
-        elif name == "draw_arc":
-            result = service.draw_arc(
-                arguments["center"],
-                arguments["radius"],
-                arguments["start_angle"],
-                arguments["end_angle"],
-                arguments.get("layer"),
-                arguments.get("color"),
-                arguments.get("lineweight"),
-            )
-        elif name == "draw_ellipse":
-            result = service.draw_ellipse(
-                arguments["center"],
-                arguments["major_axis"],
-                arguments["minor_axis"],
-                arguments.get("rotation", 0),
-                arguments.get("layer"),
-                arguments.get("color"),
-                arguments.get("lineweight"),
-            )
-        elif name == "draw_polyline":
-            result = service.draw_polyline(
-                arguments["points"],
-                arguments.get("closed", False),
-                arguments.get("layer"),
-                arguments.get("color"),
-                arguments.get("lineweight"),
-            )
-        elif name == "draw_rectangle":
-            result = service.draw_rectangle(
-                arguments["corner1"],
-                arguments["corner2"],
-                arguments.get("layer"),
-                arguments.get("color"),
-                arguments.get("lineweight"),
-            )
-        elif name == "draw_text":
-            result = service.draw_text(
-                arguments["position"],
-                arguments["text"],
-                arguments.get("height", 2.5),
-                arguments.get("rotation", 0),
-                arguments.get("layer"),
-                arguments.get("color"),
-            )
-        elif name == "draw_hatch":
-            result = service.draw_hatch(
-                arguments["boundary_points"],
-                arguments.get("pattern_name", "SOLID"),
-                arguments.get("pattern_scale", 1.0),
-                arguments.get("layer"),
-                arguments.get("color"),
-            )
-        elif name == "add_dimension":
-            result = service.add_dimension(
-                arguments["start"],
-                arguments["end"],
-                arguments["text_position"],
-                arguments.get("layer"),
-                arguments.get("color"),
-            )
-        elif name == "save_drawing":
-            result = service.save_drawing(arguments["file_path"])
-        elif name == "process_command":
-            result = service.process_natural_language(arguments["command"])
-        else:
-            result = {"success": False, "error": f"Unknown tool: {name}"}
-
-        return json.dumps(result, ensure_ascii=False, indent=2)
-
-    except Exception as e:
-        logger.exception("Error handling tool call %s", name)
-        return json.dumps({"success": False, "error": str(e)})
-
-
-def create_server() -> Server:
-    """Create and configure the MCP server."""
-    server = Server("autocad-mcp")
-
-    @server.list_resources()
-    async def list_resources() -> list[Resource]:
-        """List available resources."""
-        return [
-            Resource(
-                uri="drawing://current",
-                name="Current Drawing State",
-                description="Current state of the AutoCAD drawing including all entities",
-                mimeType="application/json",
-            )
-        ]
+RESOURCES: tuple[Resource, ...] = (
+    Resource(
+        uri="drawing://current",
+        name="Current Drawing State",
+        description="Current state of the AutoCAD drawing including all entities",
+        mimeType="application/json",
+    ),
+)
 
-    @server.read_resource()
-    async def read_resource(uri: str) -> str:
-        """Read a resource by URI."""
-        if uri == "drawing://current":
-            service = get_cad_service()
-            return json.dumps(service.state.to_dict(), ensure_ascii=False, indent=2)
-        raise ValueError(f"Unknown resource: {uri}")
-
-    @server.list_tools()
-    async def list_tools() -> list[Tool]:
-        """List available tools."""
-        return TOOLS
-
-    @server.call_tool()
-    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-        """Execute a tool call."""
-        logger.info("Tool call: %s with args: %s", name, arguments)
-        result = await handle_tool_call(name, arguments)
-        return [TextContent(type="text", text=result)]
-
-    @server.list_prompts()
-    async def list_prompts() -> list[Prompt]:
-        """List available prompts."""
-        return [
-            Prompt(
-                name="cad-assistant",
-                description="AutoCAD assistant system prompt for natural language CAD control",
-                arguments=[
-                    PromptArgument(
-                        name="task",
-                        description="The drawing task to accomplish",
-                        required=False,
-                    )
-                ],
+PROMPTS: tuple[Prompt, ...] = (
+    Prompt(
+        name="cad-assistant",
+        description="AutoCAD assistant system prompt for natural language CAD control",
+        arguments=[
+            PromptArgument(
+                name="task",
+                description="The drawing task to accomplish",
+                required=False,
             )
-        ]
+        ],
+    ),
+)
 
-    @server.get_prompt()
-    async def get_prompt(name: str, arguments: dict[str, str] | None) -> GetPromptResult:
-        """Get a specific prompt."""
-        if name == "cad-assistant":
-            task = arguments.get("task", "") if arguments else ""
-            return GetPromptResult(
-                description="AutoCAD assistant for natural language control",
-                messages=[
-                    PromptMessage(
-                        role="user",
-                        content=TextContent(
-                            type="text",
-                            text=f"""You are an AutoCAD assistant that helps users create CAD drawings through natural language commands.
+# Static part of the cad-assistant prompt; only the task line varies per call
+_CAD_ASSISTANT_PROMPT = """You are an AutoCAD assistant that helps users create CAD drawings through natural language commands.
 
 You can:
 - Draw basic shapes: lines, circles, arcs, ellipses, rectangles, polylines
@@ -1060,20 +1155,180 @@ Coordinate system:
 Colors (0-255 index):
 - 1: Red, 2: Yellow, 3: Green, 4: Cyan, 5: Blue, 6: Magenta, 7: White
 
-{f'Current task: {task}' if task else 'Waiting for drawing instructions...'}""",
-                        ),
-                    )
-                ],
-            )
-        raise ValueError(f"Unknown prompt: {name}")
+"""
+
+# Input validators compiled once from the tool schemas. Without
+# fastjsonschema the MCP server validates each call with jsonschema instead.
+_VALIDATORS: dict[str, Callable[[Any], Any]] = (
+    {tool.name: fastjsonschema.compile(tool.inputSchema) for tool in TOOLS}
+    if fastjsonschema is not None
+    else {}
+)
+
 
+# Optional layer/color/lineweight arguments shared by most draw tools
+_STYLE_ARGS: tuple[tuple[str, Any], ...] = (("layer", None), ("color", None), ("lineweight", None))
+
+# Tool name -> (service method, required argument names, optional
+# (name, default) pairs), listed in the method's positional order
+_TOOL_ARGS: dict[str, tuple[str, tuple[str, ...], tuple[tuple[str, Any], ...]]] = {
+    "draw_line": ("draw_line", ("start", "end"), _STYLE_ARGS),
+    "draw_circle": ("draw_circle", ("center", "radius"), _STYLE_ARGS),
+    "draw_arc": ("draw_arc", ("center", "radius", "start_angle", "end_angle"), _STYLE_ARGS),
+    "draw_ellipse": (
+        "draw_ellipse",
+        ("center", "major_axis", "minor_axis"),
+        (("rotation", 0), *_STYLE_ARGS),
+    ),
+    "draw_polyline": ("draw_polyline", ("points",), (("closed", False), *_STYLE_ARGS)),
+    "draw_rectangle": ("draw_rectangle", ("corner1", "corner2"), _STYLE_ARGS),
+    "draw_text": (
+        "draw_text",
+        ("position", "text"),
+        (("height", 2.5), ("rotation", 0), ("layer", None), ("color", None)),
+    ),
+    "draw_hatch": (
+        "draw_hatch",
+        ("boundary_points",),
+        (("pattern_name", "SOLID"), ("pattern_scale", 1.0), ("layer", None), ("color", None)),
+    ),
+    "add_dimension": (
+        "add_dimension",
+        ("start", "end", "text_position"),
+        (("layer", None), ("color", None)),
+    ),
+    "draw_many": ("draw_many", ("entities",), ()),
+    "save_drawing": ("save_drawing", ("file_path",), ()),
+    "process_command": ("process_natural_language", ("command",), ()),
+}
+
+
+def _arg_getter(keys: tuple[str, ...]) -> Callable[[Mapping[str, Any]], tuple[Any, ...]]:
+    """
+    Build a getter that pulls the given keys from a mapping as one tuple.
+
+    Missing keys raise KeyError, as indexing the mapping directly would.
+    """
+    getter = operator.itemgetter(*keys)
+    if len(keys) == 1:
+        return lambda args: (getter(args),)
+    return getter
+
+
+def _entity_argument_error(tool: str, entity: Mapping[str, Any]) -> str | None:
+    """
+    Check one draw_many entity against the arguments of its draw tool.
+
+    Uses the compiled schema validator when fastjsonschema is installed;
+    otherwise only checks that the required arguments are present.
+    """
+    validate = _VALIDATORS.get(tool)
+    if validate is not None:
+        try:
+            validate(entity)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return f"Invalid arguments: {e.message}"
+        return None
+
+    missing = [key for key in _TOOL_ARGS[tool][1] if key not in entity]
+    if missing:
+        return f"Missing argument: {', '.join(missing)}"
+    return None
+
+
+async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
+    """Handle a tool call and return the result as JSON string."""
+    service = get_cad_service()
+
+    try:
+        entry = service.tool_methods.get(name)
+        if entry is None:
+            result = {"success": False, "error": f"Unknown tool: {name}"}
+        else:
+            method, get_args, defaults = entry
+            result = method(*get_args(defaults | arguments))
+        return _to_json(result)
+
+    except Exception as e:
+        logger.exception("Error handling tool call %s", name)
+        return _to_json({"success": False, "error": str(e)})
+
+
+async def _list_resources() -> Sequence[Resource]:
+    """List available resources."""
+    return RESOURCES
+
+
+async def _read_resource(uri: AnyUrl) -> str:
+    """Read a resource by URI."""
+    if str(uri) == "drawing://current":
+        return get_cad_service().state_json()
+    raise ValueError(f"Unknown resource: {uri}")
+
+
+async def _list_tools() -> Sequence[Tool]:
+    """List available tools."""
+    return TOOLS
+
+
+async def _call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Execute a tool call."""
+    # Point lists can be large, so log argument names rather than values
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Tool call: %s with args: %s", name, list(arguments))
+    validate = _VALIDATORS.get(name)
+    if validate is not None:
+        try:
+            validate(arguments)
+        except fastjsonschema.JsonSchemaValueException as e:
+            # The SDK turns handler exceptions into isError results, matching
+            # its own jsonschema failures
+            raise ValueError(f"Input validation error: {e.message}") from e
+    result = await handle_tool_call(name, arguments)
+    return [TextContent(type="text", text=result)]
+
+
+async def _list_prompts() -> Sequence[Prompt]:
+    """List available prompts."""
+    return PROMPTS
+
+
+async def _get_prompt(name: str, arguments: dict[str, str] | None) -> GetPromptResult:
+    """Get a specific prompt."""
+    if name == "cad-assistant":
+        task = arguments.get("task", "") if arguments else ""
+        task_line = f"Current task: {task}" if task else "Waiting for drawing instructions..."
+        return GetPromptResult(
+            description="AutoCAD assistant for natural language control",
+            messages=[
+                PromptMessage(
+                    role="user",
+                    content=TextContent(
+                        type="text",
+                        text=_CAD_ASSISTANT_PROMPT + task_line,
+                    ),
+                )
+            ],
+        )
+    raise ValueError(f"Unknown prompt: {name}")
+
+
+def create_server() -> Server:
+    """Create and configure the MCP server."""
+    server = Server("autocad-mcp")
+    server.list_resources()(_list_resources)
+    server.read_resource()(_read_resource)
+    server.list_tools()(_list_tools)
+    server.call_tool(validate_input=not _VALIDATORS)(_call_tool)
+    server.list_prompts()(_list_prompts)
+    server.get_prompt()(_get_prompt)
     return server
 
 
 async def run_server() -> None:
     """Run the MCP server."""
     server = create_server()
-    config = load_config()
+    config = _shared_config()
 
     logger.info(
         "Starting %s v%s",
@@ -1082,12 +1337,17 @@ async def run_server() -> None:
     )
 
     # Use stdio transport for Claude Desktop integration
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        # Restore REGENMODE and redraw if the session ends mid-burst
+        if get_cad_service.cache_info().currsize:
+            get_cad_service().flush()
 
 
 def main() -> None:
@@ -0,0 +1,80 @@
+"""Tests for the CAD process pool, run against a stub controller."""
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+from autocad_mcp import cad_pool
+from autocad_mcp.config import CADConfig
+
+
+class StubController:
+    """Stands in for CADController; records how each instance was used."""
+
+    instances: list["StubController"] = []
+    starts = True
+
+    def __init__(self, config: CADConfig) -> None:
+        self.closed_with: bool | None = None
+        StubController.instances.append(self)
+
+    def start(self, new_instance: bool = False) -> bool:
+        return self.starts
+
+    @contextmanager
+    def batch(self) -> Iterator["StubController"]:
+        yield self
+
+    def close(self, quit_app: bool = False) -> None:
+        self.closed_with = quit_app
+
+    def draw_line(self, start: Any, end: Any) -> dict[str, Any]:
+        return {"success": True, "type": "line", "start": start, "end": end}
+
+
+@pytest.fixture(autouse=True)
+def stub_controller(monkeypatch: pytest.MonkeyPatch) -> None:
+    StubController.instances = []
+    StubController.starts = True
+    monkeypatch.setattr(cad_pool, "CADController", StubController)
+
+
+def test_worker_runs_tasks_and_quits_cad() -> None:
+    results = cad_pool._worker(
+        [("draw_line", ((0, 0), (1, 1)), {}), ("_private", (), {}), ("missing", (), {})],
+        {},
+    )
+
+    assert results[0]["success"] is True
+    assert results[1] == {"success": False, "error": "Unknown method: _private"}
+    assert results[2] == {"success": False, "error": "Unknown method: missing"}
+    assert [c.closed_with for c in StubController.instances] == [True]
+
+
+def test_worker_reports_failed_start_per_task() -> None:
+    StubController.starts = False
+
+    results = cad_pool._worker([("draw_line", ((0, 0), (1, 1)), {})] * 2, {})
+
+    assert results == [{"success": False, "error": "CAD not initialized"}] * 2
+    assert results[0] is not results[1]
+    assert [c.closed_with for c in StubController.instances] == [True]
+
+
+def test_map_keeps_task_order_across_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Threads instead of processes, so workers see the stub controller
+    monkeypatch.setattr(cad_pool, "ProcessPoolExecutor", ThreadPoolExecutor)
+    tasks = [("draw_line", ((i, 0), (i, 1)), {}) for i in range(7)]
+
+    results = cad_pool.ParallelCADPool(CADConfig(), max_workers=3).map(tasks)
+
+    assert [result["start"] for result in results] == [(i, 0) for i in range(7)]
+    assert len(StubController.instances) == 3
+    assert all(c.closed_with is True for c in StubController.instances)
+
+
+def test_map_without_tasks() -> None:
+    assert cad_pool.ParallelCADPool(CADConfig()).map([]) == []
@@ -0,0 +1,131 @@
+"""Tests for natural language command parsing."""
+
+from typing import Any
+
+import pytest
+
+from autocad_mcp.nlp_processor import NLPProcessor
+
+
+@pytest.fixture
+def processor() -> NLPProcessor:
+    return NLPProcessor()
+
+
+@pytest.mark.parametrize(
+    ("text", "action", "shape", "parameters"),
+    [
+        (
+            "Draw a RED circle at (100,100) radius 50",
+            "draw",
+            "circle",
+            {"center": (100, 100), "radius": 50, "color": 1},
+        ),
+        ("circle radius: 12.5", "draw", "circle", {"center": (0, 0), "radius": 12.5}),
+        # Without a keyword the radius is the first number outside a coordinate pair
+        ("draw circle 5 at (10,20)", "draw", "circle", {"center": (10, 20), "radius": 5}),
+        ("circle 10 at (0,0)", "draw", "circle", {"center": (0, 0), "radius": 10}),
+        ("画 红色 圆 半径 20", "draw", "circle", {"center": (0, 0), "radius": 20, "color": 1}),
+        ("disegna un cerchio verde", "draw", "circle", {"center": (0, 0), "radius": 50, "color": 3}),
+        (
+            "arc at (1,2) radius 10 start 0 end 180",
+            "draw",
+            "arc",
+            {"center": (1, 2), "radius": 10, "start_angle": 0, "end_angle": 180},
+        ),
+        (
+            "画一个圆弧 起始角 30 终止角 120",
+            "draw",
+            "arc",
+            {"center": (0, 0), "radius": 50, "start_angle": 30, "end_angle": 120},
+        ),
+        (
+            "椭圆 major 30 minor 10 rotation 45",
+            "draw",
+            "ellipse",
+            {"center": (0, 0), "major_axis": 30, "minor_axis": 10, "rotation": 45},
+        ),
+        ("rect width 10 height 20", "draw", "rectangle", {"corner1": (0, 0), "corner2": (10, 20)}),
+        ("矩形 宽 30 高 40", "draw", "rectangle", {"corner1": (0, 0), "corner2": (30, 40)}),
+        (
+            "draw a polyline (0,0) (1,1) (5,5) closed",
+            "draw",
+            "polyline",
+            {"points": ((0, 0), (1, 1), (5, 5)), "closed": True},
+        ),
+        (
+            "polyline closed",
+            "draw",
+            "polyline",
+            {"points": ((0, 0), (50, 50), (100, 0)), "closed": True},
+        ),
+        (
+            "draw a blue line from (0,0) to (-10.5,20)",
+            "draw",
+            "line",
+            {"start": (0, 0), "end": (-10.5, 20), "color": 5},
+        ),
+        ("draw line", "draw", "line", {"start": (0, 0), "end": (100, 100)}),
+        (
+            'add text "Hello" at (5,5) height 3 rotation 90',
+            "draw",
+            "text",
+            {"position": (5, 5), "text": "Hello", "height": 3, "rotation": 90},
+        ),
+        (
+            "dimension (0,0) (100,0)",
+            "draw",
+            "dimension",
+            {"start": (0, 0), "end": (100, 0), "text_position": (50, 10)},
+        ),
+        ("remove the circle", "erase", "circle", {"center": (0, 0), "radius": 50}),
+        ("save drawing.dwg", "save", None, {}),
+        ("move everything", "move", None, {}),
+    ],
+)
+def test_parse_command(
+    processor: NLPProcessor,
+    text: str,
+    action: str,
+    shape: str | None,
+    parameters: dict[str, Any],
+) -> None:
+    parsed = processor.parse_command(text)
+
+    assert parsed.action == action
+    assert parsed.shape == shape
+    assert dict(parsed.parameters) == parameters
+
+
+def test_extract_numbers_and_coordinates(processor: NLPProcessor) -> None:
+    assert processor.extract_numbers("(1, 2) and 3.5 and -4") == [1, 2, 3.5, -4]
+    assert processor.extract_coordinates("(1, 2) and (-3.5,4)") == [(1, 2), (-3.5, 4)]
+
+
+def test_hatch_pattern_and_scale(processor: NLPProcessor) -> None:
+    parsed = processor.parse_command("hatch (0,0) (10,0) (10,10) pattern ansi31 scale 2")
+
+    assert parsed.parameters["pattern_name"] == "ANSI31"
+    assert parsed.parameters["pattern_scale"] == 2.0
+
+
+def test_hatch_pattern_does_not_swallow_scale_keyword(processor: NLPProcessor) -> None:
+    # Regression: the pattern group used to capture "scale" as the pattern name
+    parsed = processor.parse_command("hatch (0,0) (10,0) (10,10) pattern scale 2")
+
+    assert parsed.parameters["pattern_name"] == "SOLID"
+    assert parsed.parameters["pattern_scale"] == 2.0
+
+
+def test_repeated_parameter_keeps_first_occurrence(processor: NLPProcessor) -> None:
+    parsed = processor.parse_command("circle at (0,0) radius 10 then radius 20")
+
+    assert parsed.parameters["radius"] == 10.0
+
+
+def test_parameters_are_read_only(processor: NLPProcessor) -> None:
+    parsed = processor.parse_command("circle radius 10")
+
+    with pytest.raises(TypeError):
+        parsed.parameters["radius"] = 20  # type: ignore[index]
+    assert processor.parse_command("circle radius 10").parameters["radius"] == 10.0
@@ -0,0 +1,181 @@
+"""Tests for the CAD service, run against a fake controller."""
+
+import asyncio
+import functools
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
+
+import pytest
+
+from autocad_mcp import server
+
+
+class FakeController:
+    """Stands in for CADController; counts regenerations instead of calling COM."""
+
+    def __init__(self, config: Any = None) -> None:
+        self.regens = 0
+        self.starts = 0
+        self.probes = 0
+        self.running = True
+        self.saved: list[str] = []
+
+    def start(self) -> bool:
+        self.starts += 1
+        self.running = True
+        return True
+
+    def is_running(self) -> bool:
+        self.probes += 1
+        return self.running
+
+    @contextmanager
+    def batch(self) -> Iterator["FakeController"]:
+        yield self
+        self.regens += 1
+
+    def draw_line(self, start: list[float], end: list[float], *args: Any) -> dict[str, Any]:
+        return {"success": True, "type": "line", "start": start, "end": end}
+
+    def draw_circle(self, center: list[float], radius: float, *args: Any) -> dict[str, Any]:
+        return {"success": True, "type": "circle", "center": center, "radius": radius}
+
+    def save_drawing(self, file_path: str) -> dict[str, Any]:
+        self.saved.append(file_path)
+        return {"success": True, "file_path": file_path}
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> server.CADService:
+    monkeypatch.setattr(server, "CADController", FakeController)
+    return server.CADService()
+
+
+def _controller(service: server.CADService) -> FakeController:
+    controller: FakeController = service.controller  # type: ignore[assignment]
+    return controller
+
+
+def _regens(service: server.CADService) -> int:
+    return _controller(service).regens
+
+
+def test_ensure_initialized_probes_only_after_the_deadline(service: server.CADService) -> None:
+    controller = _controller(service)
+
+    assert service.ensure_initialized()
+    assert service.ensure_initialized()
+    assert (controller.starts, controller.probes) == (1, 0)
+
+    # Expired deadline: CAD was started, so probe instead of restarting
+    service._alive_until = time.monotonic() - 1
+    assert service.ensure_initialized()
+    assert (controller.starts, controller.probes) == (1, 1)
+
+    # CAD died: the failed probe leads to a restart
+    service._alive_until = time.monotonic() - 1
+    controller.running = False
+    assert service.ensure_initialized()
+    assert (controller.starts, controller.probes) == (2, 2)
+
+
+def test_draw_many_reports_each_failure(service: server.CADService) -> None:
+    result = service.draw_many([
+        {"type": "line", "start": [0, 0], "end": [1, 1]},
+        {"type": "circle", "center": [0, 0]},
+        {"type": "circle", "center": [0, 0], "radius": -1},
+        {"type": "spline"},
+        {"type": "circle", "center": [5, 5], "radius": 2},
+    ])
+
+    assert result["success"] is False
+    assert result["count"] == 2
+    assert [error["index"] for error in result["errors"]] == [1, 2, 3]
+    assert "radius" in result["errors"][0]["error"]
+    assert result["errors"][2]["error"] == "Unknown entity type: spline"
+
+
+def test_draw_many_reports_missing_argument_without_validators(
+    service: server.CADService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(server, "_VALIDATORS", {})
+
+    result = service.draw_many([{"type": "circle", "center": [0, 0]}])
+
+    assert result["errors"] == [{"index": 0, "error": "Missing argument: radius"}]
+
+
+def test_draw_many_regenerates_once(service: server.CADService) -> None:
+    entities = [
+        {"type": "line", "start": [i, 0], "end": [i, 1]}
+        for i in range(server._FLUSH_THRESHOLD * 3)
+    ]
+
+    result = service.draw_many(entities)
+
+    assert result == {"success": True, "type": "batch", "count": len(entities), "errors": []}
+    assert _regens(service) == 1
+
+
+def test_draw_outside_event_loop_regenerates_immediately(service: server.CADService) -> None:
+    service.draw_line([0, 0], [1, 1])
+    service.draw_line([1, 1], [2, 2])
+
+    assert _regens(service) == 2
+
+
+async def test_burst_of_draws_regenerates_once_when_idle(
+    service: server.CADService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(server, "_FLUSH_DELAY", 0.01)
+
+    for i in range(3):
+        service.draw_line([i, 0], [i, 1])
+    assert _regens(service) == 0
+
+    await asyncio.sleep(0.05)
+    assert _regens(service) == 1
+
+
+async def test_threshold_regenerates_without_waiting(service: server.CADService) -> None:
+    for i in range(server._FLUSH_THRESHOLD):
+        service.draw_line([i, 0], [i, 1])
+
+    assert _regens(service) == 1
+
+
+async def test_save_flushes_pending_draws(service: server.CADService) -> None:
+    service.draw_line([0, 0], [1, 1])
+
+    result = service.save_drawing("out.dwg")
+
+    assert result["success"] is True
+    assert _regens(service) == 1
+
+
+async def test_shutdown_flushes_pending_draws(
+    service: server.CADService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class IdleServer:
+        async def run(self, *args: Any) -> None:
+            pass
+
+        def create_initialization_options(self) -> None:
+            return None
+
+    @asynccontextmanager
+    async def fake_stdio() -> AsyncIterator[tuple[None, None]]:
+        yield None, None
+
+    cached_service = functools.lru_cache(maxsize=1)(lambda: service)
+    cached_service()
+    monkeypatch.setattr(server, "get_cad_service", cached_service)
+    monkeypatch.setattr(server, "create_server", IdleServer)
+    monkeypatch.setattr(server, "stdio_server", fake_stdio)
+
+    service.draw_line([0, 0], [1, 1])
+    await server.run_server()
+
+    assert _regens(service) == 1